@@ -10,7 +10,8 @@ from scripts.constants import (
     JWT_ALGORITHM,
     TOKEN_EXPIRY_HOURS,
     MAX_LOGIN_ATTEMPTS,
-    ACCOUNT_LOCKOUT_MINUTES
+    ACCOUNT_LOCKOUT_MINUTES,
+    BCRYPT_ROUNDS
 )
 from scripts.exceptions import (
     AuthenticationError,
@@ -23,7 +24,7 @@ logger = get_logger(__name__)
 
 def hash_password(password: str) -> str:
     """
-    Hash password using bcrypt with 12 rounds.
+    Hash password using bcrypt with BCRYPT_ROUNDS rounds (default 12).
 
     Args:
         password: Plain text password
@@ -36,7 +37,7 @@ def hash_password(password: str) -> str:
         >>> len(hashed) > 50
         True
     """
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     password_hash = bcrypt.hashpw(password.encode('utf-8'), salt)
     return password_hash.decode('utf-8')
 
@@ -115,6 +115,9 @@ ACCOUNT_LOCKOUT_MINUTES = 15
 JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'CHANGE_THIS_IN_PRODUCTION')
 JWT_ALGORITHM = 'HS256'
 
+# Password hashing cost (bcrypt log2 rounds)
+BCRYPT_ROUNDS = 12
+
 # Password Requirements
 MIN_PASSWORD_LENGTH = 8
 PASSWORD_REQUIRE_UPPERCASE = True
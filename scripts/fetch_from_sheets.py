@@ -9,6 +9,7 @@ Environment Variables:
 """
 import os
 import json
+import functools
 import pandas as pd
 from typing import List, Dict, Any, Optional, Union
 from google.oauth2 import service_account
@@ -28,13 +29,21 @@ from scripts.constants import (
     DEFAULT_OUTPUT_CSV,
     DEFAULT_OUTPUT_JSON,
     DEFAULT_SHEET_NAME,
+    DEFAULT_CONFIG_FILE,
     SHEETS_RANGE_TEMPLATE,
     CURRENCY_METRICS,
     EXCHANGE_RATE_KEYWORDS
 )
 
-# Load environment variables from .env file
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Load environment variables from .env file. Production deployments inject
+# the environment directly, so skip the .env lookup there.
+if os.getenv('PRODUCTION') != '1':
+    load_dotenv()
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -53,31 +62,68 @@ OUTPUT_CSV = DEFAULT_OUTPUT_CSV
 OUTPUT_JSON = DEFAULT_OUTPUT_JSON
 
 
-def get_credentials() -> service_account.Credentials:
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to indented UTF-8 JSON bytes.
+
+    Uses orjson when installed (NumPy values pass straight through),
+    otherwise falls back to the standard library encoder.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document, using orjson when installed.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Any: Parsed JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def get_credentials(credentials_file: Optional[str] = None) -> service_account.Credentials:
     """
     Get credentials for Google API.
 
+    Args:
+        credentials_file: Service account JSON path (default: CREDENTIALS_FILE)
+
     Returns:
         service_account.Credentials: Google service account credentials
 
     Raises:
         CredentialsError: If credentials file is not found or invalid
     """
-    if not os.path.exists(CREDENTIALS_FILE):
-        logger.error(f"Credentials file not found: {CREDENTIALS_FILE}")
+    credentials_file = credentials_file or CREDENTIALS_FILE
+    if not os.path.exists(credentials_file):
+        logger.error(f"Credentials file not found: {credentials_file}")
         logger.error("Please set GOOGLE_CREDENTIALS_FILE environment variable or place "
-                    f"credentials at {CREDENTIALS_FILE}")
+                    f"credentials at {credentials_file}")
         logger.error("See README.md for setup instructions.")
         raise CredentialsError(
-            f"Credentials file not found: {CREDENTIALS_FILE}. "
+            f"Credentials file not found: {credentials_file}. "
             f"Please set GOOGLE_CREDENTIALS_FILE environment variable. "
             f"See README.md for setup instructions."
         )
 
     try:
-        logger.debug(f"Loading credentials from: {CREDENTIALS_FILE}")
+        logger.debug(f"Loading credentials from: {credentials_file}")
         creds = service_account.Credentials.from_service_account_file(
-            CREDENTIALS_FILE, scopes=SCOPES)
+            credentials_file, scopes=SCOPES)
         logger.info("Successfully loaded Google API credentials")
         return creds
     except (ValueError, KeyError, json.JSONDecodeError) as e:
@@ -85,36 +131,43 @@ def get_credentials() -> service_account.Credentials:
         raise CredentialsError(f"Invalid credentials file: {e}") from e
 
 
-def get_sheets_service() -> Any:
+def get_sheets_service(credentials_file: Optional[str] = None) -> Any:
     """
     Initialize and return Google Sheets API service.
 
+    Args:
+        credentials_file: Service account JSON path (default: CREDENTIALS_FILE)
+
     Returns:
         Any: Google Sheets API service resource
     """
-    creds = get_credentials()
+    creds = get_credentials(credentials_file)
     service = build('sheets', 'v4', credentials=creds)
     return service
 
 
-def get_drive_service() -> Any:
+def get_drive_service(credentials_file: Optional[str] = None) -> Any:
     """
     Initialize and return Google Drive API service.
 
+    Args:
+        credentials_file: Service account JSON path (default: CREDENTIALS_FILE)
+
     Returns:
         Any: Google Drive API service resource
     """
-    creds = get_credentials()
+    creds = get_credentials(credentials_file)
     service = build('drive', 'v3', credentials=creds)
     return service
 
 
-def download_excel_from_drive(file_id: str) -> Dict[str, pd.DataFrame]:
+def download_excel_from_drive(file_id: str, credentials_file: Optional[str] = None) -> Dict[str, pd.DataFrame]:
     """
     Download Excel file from Google Drive and read it.
 
     Args:
         file_id: Google Drive file ID
+        credentials_file: Service account JSON path (default: CREDENTIALS_FILE)
 
     Returns:
         Dict[str, pd.DataFrame]: Dictionary mapping sheet names to DataFrames
@@ -127,7 +180,7 @@ def download_excel_from_drive(file_id: str) -> Dict[str, pd.DataFrame]:
 
     try:
         logger.info(f"Downloading Excel file from Google Drive (ID: {file_id[:10]}...)")
-        drive_service = get_drive_service()
+        drive_service = get_drive_service(credentials_file)
 
         # Get file metadata
         file_metadata = drive_service.files().get(fileId=file_id).execute()
@@ -163,13 +216,64 @@ def download_excel_from_drive(file_id: str) -> Dict[str, pd.DataFrame]:
         raise DataFetchError(f"File operation failed: {e}") from e
 
 
-def fetch_sheet_data(spreadsheet_id: str, sheet_name: str = 'dashboard') -> List[List[str]]:
+def _batch_get_values(service: Any, spreadsheet_id: str, sheet_name: str) -> List[List[str]]:
+    """
+    Read the configured range of a sheet in a single batchGet round-trip.
+
+    Args:
+        service: Google Sheets API service resource
+        spreadsheet_id: Google Sheets spreadsheet ID
+        sheet_name: Name of the sheet to read
+
+    Returns:
+        List[List[str]]: 2D list of cell values (empty if the range has no data)
+    """
+    result = service.spreadsheets().values().batchGet(
+        spreadsheetId=spreadsheet_id,
+        ranges=[SHEETS_RANGE_TEMPLATE.format(sheet_name=sheet_name)]
+    ).execute()
+
+    value_ranges = result.get('valueRanges', [])
+    return value_ranges[0].get('values', []) if value_ranges else []
+
+
+def _get_sheet_titles(service: Any, spreadsheet_id: str) -> List[str]:
+    """
+    List the sheet titles of a spreadsheet.
+
+    Args:
+        service: Google Sheets API service resource
+        spreadsheet_id: Google Sheets spreadsheet ID
+
+    Returns:
+        List[str]: Sheet titles, or an empty list if metadata is unavailable
+    """
+    try:
+        metadata = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+    except HttpError as e:
+        logger.warning(f"Could not get spreadsheet metadata: {e}")
+        return []
+
+    sheet_titles = [s['properties']['title'] for s in metadata.get('sheets', [])]
+    logger.info(f"Available sheets: {sheet_titles}")
+    return sheet_titles
+
+
+def fetch_sheet_data(
+    spreadsheet_id: str,
+    sheet_name: str = 'dashboard',
+    credentials_file: Optional[str] = None
+) -> List[List[str]]:
     """
     Fetch data from Google Sheets.
 
+    Reads the requested sheet directly; spreadsheet metadata is only
+    fetched when that read fails, to fall back to the first sheet.
+
     Args:
         spreadsheet_id: Google Sheets spreadsheet ID
         sheet_name: Name of the sheet to read (default: 'dashboard')
+        credentials_file: Service account JSON path (default: CREDENTIALS_FILE)
 
     Returns:
         List[List[str]]: 2D list of cell values
@@ -178,32 +282,21 @@ def fetch_sheet_data(spreadsheet_id: str, sheet_name: str = 'dashboard') -> List
         ValueError: If no data found in the sheet
     """
     logger.info(f"Fetching data from Google Sheets (ID: {spreadsheet_id[:10]}...)")
-    service = get_sheets_service()
+    service = get_sheets_service(credentials_file)
 
-    # First, try to get spreadsheet metadata to see available sheets
+    logger.debug(f"Reading data from sheet: {sheet_name}")
     try:
-        metadata = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-        sheets = metadata.get('sheets', [])
-        sheet_titles = [s['properties']['title'] for s in sheets]
-        logger.info(f"Available sheets: {sheet_titles}")
+        values = _batch_get_values(service, spreadsheet_id, sheet_name)
+    except HttpError:
+        # Most likely the sheet doesn't exist - look up available sheets
+        sheet_titles = _get_sheet_titles(service, spreadsheet_id)
 
         # If sheet_name not found, use first sheet
-        if sheet_name not in sheet_titles and sheets:
-            sheet_name = sheet_titles[0]
-            logger.warning(f"Requested sheet not found. Using first sheet: {sheet_name}")
-    except HttpError as e:
-        logger.warning(f"Could not get spreadsheet metadata: {e}")
-        # Continue anyway with provided sheet_name
-
-    # Get the data from the sheet
-    logger.debug(f"Reading data from sheet: {sheet_name}")
-    sheet = service.spreadsheets()
-    result = sheet.values().get(
-        spreadsheetId=spreadsheet_id,
-        range=f'{sheet_name}!A:Z'  # Adjust range as needed
-    ).execute()
-
-    values = result.get('values', [])
+        if sheet_name in sheet_titles or not sheet_titles:
+            raise
+        sheet_name = sheet_titles[0]
+        logger.warning(f"Requested sheet not found. Using first sheet: {sheet_name}")
+        values = _batch_get_values(service, spreadsheet_id, sheet_name)
 
     if not values:
         logger.error('No data found in the sheet')
@@ -344,13 +437,18 @@ def convert_to_long_format(df: pd.DataFrame) -> pd.DataFrame:
     return df_long
 
 
-def prepare_dashboard_json(df_usd: pd.DataFrame, df_eur: pd.DataFrame) -> Dict[str, Any]:
+def prepare_dashboard_json(
+    df_usd: pd.DataFrame,
+    df_eur: pd.DataFrame,
+    base_dir: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Prepare JSON format for dashboard consumption with both USD and EUR.
 
     Args:
         df_usd: DataFrame with USD values
         df_eur: DataFrame with EUR values
+        base_dir: Directory containing config.json (default: current working directory)
 
     Returns:
         Dict[str, Any]: Dictionary with metrics, periods, values_usd, values_eur
@@ -415,7 +513,7 @@ def prepare_dashboard_json(df_usd: pd.DataFrame, df_eur: pd.DataFrame) -> Dict[s
         data['values_eur'][metric_name] = values
 
     # Apply filtering from config if available
-    config = load_config()
+    config = load_config(base_dir)
     if config and 'data_settings' in config:
         exclude_periods = config['data_settings'].get('exclude_periods', [])
         if exclude_periods:
@@ -442,21 +540,53 @@ def prepare_dashboard_json(df_usd: pd.DataFrame, df_eur: pd.DataFrame) -> Dict[s
     return data
 
 
-def load_config() -> Optional[Dict[str, Any]]:
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Read and parse a config file, memoized on its path and modification time.
+
+    Args:
+        config_path: Absolute path to the config file
+        mtime_ns: File modification time, so edits invalidate the cached entry
+
+    Returns:
+        Dict[str, Any]: Parsed configuration dictionary
+    """
+    with open(config_path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def load_config(base_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
     Load configuration from config.json.
 
+    The parsed file is cached per path and modification time, so repeated
+    calls within a run skip the read and JSON parse. Treat the returned
+    dictionary as read-only since it is shared between callers.
+
+    Args:
+        base_dir: Directory containing config.json (default: current working directory)
+
     Returns:
         Optional[Dict[str, Any]]: Configuration dictionary or None if file not found
     """
-    config_path = 'config.json'
-    if os.path.exists(config_path):
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    return None
+    config_path = os.path.abspath(os.path.join(base_dir or '', DEFAULT_CONFIG_FILE))
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _load_config_cached(config_path, mtime_ns)
+
+
+load_config.cache_clear = _load_config_cached.cache_clear
 
 
-def main(spreadsheet_id: Optional[str] = None, sheet_name: str = 'dashboard') -> None:
+def main(
+    spreadsheet_id: Optional[str] = None,
+    sheet_name: str = 'dashboard',
+    credentials_file: Optional[str] = None,
+    base_dir: Optional[str] = None
+) -> Optional[str]:
     """
     Main execution function.
 
@@ -466,10 +596,22 @@ def main(spreadsheet_id: Optional[str] = None, sheet_name: str = 'dashboard') ->
     Args:
         spreadsheet_id: Google Drive file ID or Sheets ID (optional, reads from env/config)
         sheet_name: Name of the sheet to read (default: 'dashboard')
+        credentials_file: Service account JSON path overriding
+                          GOOGLE_CREDENTIALS_FILE (optional, for in-process callers)
+        base_dir: Directory that relative config, credentials and output paths
+                  resolve against (default: current working directory)
+
+    Returns:
+        Path of the saved dashboard JSON, or None if no file ID is configured
 
     Raises:
         Exception: If data fetching or processing fails
     """
+    output_csv = os.path.join(base_dir, OUTPUT_CSV) if base_dir else OUTPUT_CSV
+    output_json = os.path.join(base_dir, OUTPUT_JSON) if base_dir else OUTPUT_JSON
+    if base_dir:
+        credentials_file = os.path.join(base_dir, credentials_file or CREDENTIALS_FILE)
+
     logger.info("=" * 60)
     logger.info("Starting Dashboard Data Fetch Process")
     logger.info("=" * 60)
@@ -484,7 +626,7 @@ def main(spreadsheet_id: Optional[str] = None, sheet_name: str = 'dashboard') ->
             logger.info("Using file ID from environment variable")
         else:
             # Priority 2: Fall back to config.json (LEGACY - use .env instead!)
-            config = load_config()
+            config = load_config(base_dir)
             if config and config.get('google_drive_file_id') and config['google_drive_file_id'] != 'YOUR_FILE_ID_HERE':
                 spreadsheet_id = config['google_drive_file_id']
                 sheet_name = config.get('sheet_name', sheet_name)
@@ -496,7 +638,7 @@ def main(spreadsheet_id: Optional[str] = None, sheet_name: str = 'dashboard') ->
                 logger.error("  2. Pass as argument: python scripts/fetch_from_sheets.py <file_id>")
                 logger.error("  3. (LEGACY) Update config.json")
                 logger.error("See .env.example for secure setup instructions.")
-                return
+                return None
 
     logger.info("Fetching data from Google...")
     logger.info(f"File ID: {spreadsheet_id[:10]}...")
@@ -506,13 +648,13 @@ def main(spreadsheet_id: Optional[str] = None, sheet_name: str = 'dashboard') ->
         # Try Google Sheets API first
         try:
             logger.info("Attempting to read as Google Sheets...")
-            values = fetch_sheet_data(spreadsheet_id, sheet_name)
+            values = fetch_sheet_data(spreadsheet_id, sheet_name, credentials_file)
             logger.info(f"Successfully fetched {len(values)} rows")
             df = convert_to_dataframe(values)
         except Exception as e:
             logger.info("Not a Google Sheet, trying as Excel file from Drive...")
             # Try as Excel file from Drive
-            excel_data = download_excel_from_drive(spreadsheet_id)
+            excel_data = download_excel_from_drive(spreadsheet_id, credentials_file)
 
             # Find the sheet with matching name or use first sheet
             if sheet_name in excel_data:
@@ -534,22 +676,24 @@ def main(spreadsheet_id: Optional[str] = None, sheet_name: str = 'dashboard') ->
         df_eur = convert_to_eur(df_usd.copy())
 
         # Save wide format CSV (EUR version)
-        logger.info(f"Saving wide format CSV to: {OUTPUT_CSV}")
-        df_eur.to_csv(OUTPUT_CSV, index=False)
+        logger.info(f"Saving wide format CSV to: {output_csv}")
+        df_eur.to_csv(output_csv, index=False)
         logger.info(f"Successfully saved CSV")
 
         # Prepare and save JSON for dashboard with both currencies
         logger.info("Preparing dashboard JSON with dual currency support...")
-        dashboard_data = prepare_dashboard_json(df_usd, df_eur)
-        with open(OUTPUT_JSON, 'w') as f:
-            json.dump(dashboard_data, f, indent=2)
-        logger.info(f"Successfully saved dashboard JSON to: {OUTPUT_JSON}")
+        dashboard_data = prepare_dashboard_json(df_usd, df_eur, base_dir)
+        with open(output_json, 'wb') as f:
+            f.write(_json_dumps(dashboard_data))
+        logger.info(f"Successfully saved dashboard JSON to: {output_json}")
 
         logger.info("=" * 60)
         logger.info("Data pipeline completed successfully!")
         logger.info("Dashboard is ready to view at: dashboard/index.html")
         logger.info("=" * 60)
 
+        return output_json
+
     except (CredentialsError, DataFetchError, DataProcessingError) as e:
         logger.error(f"Error in data pipeline: {str(e)}", exc_info=True)
         raise
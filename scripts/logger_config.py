@@ -5,6 +5,7 @@ This module provides a consistent logging setup across all scripts with:
 - Timestamped log entries
 - Both console and file output
 - Log rotation to manage file sizes
+- Non-blocking file output (records are written by a background thread)
 - Different log levels for development vs production
 - Structured logging format
 
@@ -16,10 +17,61 @@ Usage:
     logger.warning("Unusual condition detected")
     logger.error("An error occurred", exc_info=True)
 """
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional, Tuple
+
+# Shared file logging (singleton): loggers enqueue records and a single
+# background listener thread writes them to the rotating log file
+_file_handler: Optional[RotatingFileHandler] = None
+_queue_handler: Optional[QueueHandler] = None
+_queue_listener: Optional[QueueListener] = None
+
+
+def _get_file_handlers() -> Tuple[QueueHandler, RotatingFileHandler]:
+    """
+    Get the shared queue handler and the rotating file handler behind it.
+
+    The first call creates the log directory, the file handler and a
+    QueueListener that drains the queue on a background thread, so log
+    calls only enqueue a record instead of blocking on disk I/O.
+
+    Returns:
+        Tuple of (QueueHandler to attach to loggers, RotatingFileHandler)
+    """
+    global _file_handler, _queue_handler, _queue_listener
+
+    if _queue_handler is None:
+        # Create logs directory if it doesn't exist
+        log_dir = Path(__file__).parent.parent / 'logs'
+        log_dir.mkdir(parents=True, exist_ok=True)
+
+        # File handler with rotation (DEBUG and above)
+        _file_handler = RotatingFileHandler(
+            log_dir / 'dashboard.log',
+            maxBytes=10 * 1024 * 1024,  # 10 MB
+            backupCount=5,
+            encoding='utf-8'
+        )
+        _file_handler.setLevel(logging.DEBUG)
+        _file_handler.setFormatter(logging.Formatter(
+            fmt='%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+
+        log_queue = queue.SimpleQueue()
+        _queue_handler = QueueHandler(log_queue)
+        _queue_handler.setLevel(logging.DEBUG)
+
+        _queue_listener = QueueListener(log_queue, _file_handler, respect_handler_level=True)
+        _queue_listener.start()
+        atexit.register(_queue_listener.stop)
+
+    return _queue_handler, _file_handler
 
 
 def get_logger(name: str, log_level: str = None) -> logging.Logger:
@@ -52,12 +104,6 @@ def get_logger(name: str, log_level: str = None) -> logging.Logger:
 
     logger.setLevel(getattr(logging, log_level))
 
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        fmt='%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-
     console_formatter = logging.Formatter(
         fmt='%(asctime)s | %(levelname)-8s | %(message)s',
         datefmt='%H:%M:%S'
@@ -69,21 +115,16 @@ def get_logger(name: str, log_level: str = None) -> logging.Logger:
     console_handler.setFormatter(console_formatter)
     logger.addHandler(console_handler)
 
-    # File handler with rotation (DEBUG and above)
-    # Create logs directory if it doesn't exist
-    log_dir = Path(__file__).parent.parent / 'logs'
-    log_dir.mkdir(exist_ok=True)
-
-    log_file = log_dir / 'dashboard.log'
-    file_handler = RotatingFileHandler(
-        log_file,
-        maxBytes=10 * 1024 * 1024,  # 10 MB
-        backupCount=5,
-        encoding='utf-8'
-    )
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
+    # File output goes through the shared queue (DEBUG and above)
+    queue_handler, file_handler = _get_file_handlers()
+    logger.addHandler(queue_handler)
+
+    # Index handlers by role so callers don't have to scan logger.handlers
+    logger._handler_index = {
+        'console': console_handler,
+        'queue': queue_handler,
+        'file': file_handler
+    }
 
     # Prevent propagation to root logger
     logger.propagate = False
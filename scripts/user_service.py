@@ -4,7 +4,9 @@ User management service for CRUD operations.
 Handles user creation, retrieval, updates, and soft deletion
 with proper validation and error handling.
 """
+import re
 from typing import List, Optional
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -15,6 +17,16 @@ from scripts.logger_config import get_logger
 
 logger = get_logger(__name__)
 
+VALID_ROLES = ('admin', 'editor', 'viewer')
+
+# Compiled once at import; validation runs on every create/update
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _is_valid_email(email: Optional[str]) -> bool:
+    """Return True if email looks like local@domain.tld."""
+    return bool(email) and _EMAIL_RE.match(email) is not None
+
 
 class UserService:
     """
@@ -54,7 +66,7 @@ class UserService:
             DashboardError: If database operation fails
         """
         # Validate email format
-        if not email or '@' not in email:
+        if not _is_valid_email(email):
             raise ValidationError('Invalid email format')
 
         # Validate password strength
@@ -62,9 +74,8 @@ class UserService:
             raise ValidationError('Password must be at least 8 characters')
 
         # Validate role
-        valid_roles = ['admin', 'editor', 'viewer']
-        if role not in valid_roles:
-            raise ValidationError(f'Invalid role. Must be one of: {", ".join(valid_roles)}')
+        if role not in VALID_ROLES:
+            raise ValidationError(f'Invalid role. Must be one of: {", ".join(VALID_ROLES)}')
 
         try:
             # Hash password
@@ -108,7 +119,10 @@ class UserService:
             User object or None if not found
         """
         try:
-            user = self.db_session.query(User).filter(User.id == user_id).first()
+            # lambda_stmt caches the statement construction per call site;
+            # user_id is extracted as a bound parameter
+            stmt = lambda_stmt(lambda: select(User).where(User.id == user_id))
+            user = self.db_session.execute(stmt).scalars().first()
             if user:
                 logger.debug(f"User retrieved by ID: {user_id}")
             return user
@@ -127,7 +141,8 @@ class UserService:
             User object or None if not found
         """
         try:
-            user = self.db_session.query(User).filter(User.email == email).first()
+            stmt = lambda_stmt(lambda: select(User).where(User.email == email))
+            user = self.db_session.execute(stmt).scalars().first()
             if user:
                 logger.debug(f"User retrieved by email: {email}")
             return user
@@ -167,7 +182,7 @@ class UserService:
         try:
             # Update email if provided
             if email is not None:
-                if not email or '@' not in email:
+                if not _is_valid_email(email):
                     raise ValidationError('Invalid email format')
                 user.email = email
 
@@ -179,9 +194,8 @@ class UserService:
 
             # Update role if provided
             if role is not None:
-                valid_roles = ['admin', 'editor', 'viewer']
-                if role not in valid_roles:
-                    raise ValidationError(f'Invalid role. Must be one of: {", ".join(valid_roles)}')
+                if role not in VALID_ROLES:
+                    raise ValidationError(f'Invalid role. Must be one of: {", ".join(VALID_ROLES)}')
                 user.role = role
 
             # Update active status if provided
@@ -263,9 +277,8 @@ class UserService:
 
             # Filter by role if provided
             if role is not None:
-                valid_roles = ['admin', 'editor', 'viewer']
-                if role not in valid_roles:
-                    raise ValidationError(f'Invalid role. Must be one of: {", ".join(valid_roles)}')
+                if role not in VALID_ROLES:
+                    raise ValidationError(f'Invalid role. Must be one of: {", ".join(VALID_ROLES)}')
                 query = query.filter(User.role == role)
 
             # Filter by active status if requested
@@ -5,8 +5,16 @@ Validates dashboard data for missing values, negative amounts,
 period continuity, currency rates, and other quality issues.
 """
 import json
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import chain
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Session
 
@@ -17,6 +25,83 @@ from scripts.logger_config import get_logger
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class Issue:
+    """
+    Single data quality issue found by a validation check.
+
+    The check_* methods return these; validate_data_quality stores them
+    in reports as plain dicts via ``to_dict()``.
+
+    Args:
+        severity: 'critical', 'warning' or 'info'
+        category: Check category (e.g. 'missing_data', 'currency_rates')
+        message: Human-readable description
+    """
+    __slots__ = ('severity', 'category', 'message')
+
+    severity: str
+    category: str
+    message: str
+
+    def to_dict(self) -> Dict[str, str]:
+        """Convert to the dict form stored in validation reports."""
+        return {'severity': self.severity, 'category': self.category, 'message': self.message}
+
+
+# Period column headers look like "Jan-25" (MMM-YY)
+_PERIOD_RE = re.compile(r'^([A-Z][a-z]{2})-(\d{2})$')
+_MONTHS = frozenset(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+
+
+def _is_period_header(column: str) -> bool:
+    """Return True if column is an MMM-YY period header with a real month name."""
+    match = _PERIOD_RE.match(column)
+    return match is not None and match.group(1) in _MONTHS
+
+
+def _index_by_kpi(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Index dashboard data by KPI name for direct row lookups.
+
+    Args:
+        data: DataFrame with dashboard data (KPI names in 'month')
+
+    Returns:
+        pd.DataFrame: First row of each KPI, indexed by KPI name, with the
+            period columns' raw (unconverted) values
+    """
+    return data.drop_duplicates('month').set_index('month')
+
+
+# Below this many cells the checks finish faster than a thread handoff
+PARALLEL_CHECK_MIN_CELLS = 50_000
+
+# Shared pool for running independent checks concurrently (created on first use).
+# The lock keeps concurrent first calls, e.g. from server threads, from each
+# creating (and leaking) a pool.
+_check_executor: Optional[ThreadPoolExecutor] = None
+_check_executor_lock = threading.Lock()
+
+
+def _get_check_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool used to run validation checks concurrently.
+
+    Returns:
+        ThreadPoolExecutor: Module-level pool with one worker per check
+    """
+    global _check_executor
+
+    if _check_executor is None:
+        with _check_executor_lock:
+            if _check_executor is None:
+                _check_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='validation-check')
+
+    return _check_executor
+
+
 class ValidationService:
     """
     Data validation service for quality checks and reporting.
@@ -57,13 +142,31 @@ class ValidationService:
                     'issues': [{'severity': 'warning', 'category': '...', 'message': '...'}]
                 }
         """
-        issues = []
-
-        # Run all validation checks
-        issues.extend(self.check_missing_values(data))
-        issues.extend(self.check_negative_values(data))
-        issues.extend(self.check_period_continuity(data))
-        issues.extend(self.check_currency_rates(data))
+        # Run all validation checks; missing/negative checks can only find
+        # something when the data has a NaN, a negative or a non-numeric value
+        has_kpis = not data.empty and 'month' in data.columns
+        clean = self._has_clean_values(data)
+        if clean:
+            logger.debug("No missing or negative values, skipping cell-level checks")
+
+        # The row-level checks share one KPI-indexed view of the data
+        kpi_rows = _index_by_kpi(data) if has_kpis else None
+        checks = []
+        if not clean:
+            checks.append(partial(self.check_missing_values, data))
+            if has_kpis:
+                checks.append(partial(self._check_negative_values, kpi_rows))
+        checks.append(partial(self.check_period_continuity, data))
+        if has_kpis:
+            checks.append(partial(self._check_currency_rates, kpi_rows))
+
+        # The checks only read the data, so large inputs can be checked
+        # concurrently; map() keeps results in the order the checks are listed
+        if data.size >= PARALLEL_CHECK_MIN_CELLS:
+            results = _get_check_executor().map(lambda check: check(), checks)
+        else:
+            results = (check() for check in checks)
+        issues = list(chain.from_iterable(results))
 
         # Categorize issues by severity
         summary = self.categorize_issues(issues)
@@ -79,7 +182,7 @@ class ValidationService:
         report = {
             'status': status,
             'summary': summary,
-            'issues': issues,
+            'issues': [issue.to_dict() for issue in issues],
             'data_file': data_file,
             'timestamp': datetime.utcnow().isoformat()
         }
@@ -91,7 +194,32 @@ class ValidationService:
 
         return report
 
-    def check_missing_values(self, data: pd.DataFrame) -> List[Dict[str, str]]:
+    def _has_clean_values(self, data: pd.DataFrame) -> bool:
+        """
+        Quick whole-frame check used to skip the missing/negative checks.
+
+        Args:
+            data: DataFrame with dashboard data
+
+        Returns:
+            bool: True if the data is non-empty, has no missing cells, and
+                every period column is numeric with no negative values
+        """
+        if data.empty or 'month' not in data.columns:
+            return False
+
+        if data.isna().values.any():
+            return False
+
+        period_data = data.drop(columns=['month'])
+        numeric_data = period_data.select_dtypes('number')
+        # Object columns may hold non-numeric values that need reporting
+        if numeric_data.shape[1] != period_data.shape[1]:
+            return False
+
+        return not (numeric_data.values < 0).any()
+
+    def check_missing_values(self, data: pd.DataFrame) -> List[Issue]:
         """
         Check for missing values in critical fields.
 
@@ -99,64 +227,63 @@ class ValidationService:
             data: DataFrame with dashboard data
 
         Returns:
-            List of issue dictionaries
+            List of Issue objects
         """
         issues = []
 
         # Check if DataFrame is empty
         if data.empty:
-            issues.append({
-                'severity': 'critical',
-                'category': 'missing_data',
-                'message': 'Dataset is completely empty'
-            })
+            issues.append(Issue(
+                severity='critical',
+                category='missing_data',
+                message='Dataset is completely empty'
+            ))
             return issues
 
         # Check for missing KPI rows (first column should be KPI names)
         if 'month' in data.columns:
             missing_kpis = data[data['month'].isna()]
             if not missing_kpis.empty:
-                issues.append({
-                    'severity': 'critical',
-                    'category': 'missing_data',
-                    'message': f'Found {len(missing_kpis)} rows with missing KPI names'
-                })
+                issues.append(Issue(
+                    severity='critical',
+                    category='missing_data',
+                    message=f'Found {len(missing_kpis)} rows with missing KPI names'
+                ))
 
         # Check for missing values in period columns (all columns except 'month')
         period_columns = [col for col in data.columns if col != 'month']
 
-        # Check for missing currency rates (critical)
-        rate_row = data[data['month'] == 'USD/EUR Rate']
-        if not rate_row.empty:
-            for col in period_columns:
-                value = rate_row[col].values[0]
-                if pd.isna(value):
-                    issues.append({
-                        'severity': 'critical',
-                        'category': 'missing_data',
-                        'message': f'Missing currency rate data in column {col}'
-                    })
-
-        # Check for missing KPI values in other rows (warnings)
-        for col in period_columns:
-            missing_count = data[col].isna().sum()
-            # Only count missing values not in the currency rate row (already checked above)
-            if missing_count > 0:
-                # Count missing values excluding currency rate row
-                non_rate_missing = data[(data['month'] != 'USD/EUR Rate') & (data[col].isna())]
-                if not non_rate_missing.empty:
-                    issues.append({
-                        'severity': 'warning',
-                        'category': 'missing_data',
-                        'message': f'Missing values in column {col}: {len(non_rate_missing)} values'
-                    })
+        # One vectorized pass builds the NaN mask; most datasets have no gaps
+        missing = data[period_columns].isna()
+        if missing.values.any():
+            is_rate_row = (data['month'] == 'USD/EUR Rate').to_numpy()
+
+            # Check for missing currency rates (critical)
+            if is_rate_row.any():
+                rate_missing = missing[is_rate_row].iloc[0]
+                for col in rate_missing.index[rate_missing.to_numpy()]:
+                    issues.append(Issue(
+                        severity='critical',
+                        category='missing_data',
+                        message=f'Missing currency rate data in column {col}'
+                    ))
+
+            # Check for missing KPI values in other rows (warnings),
+            # excluding the currency rate row (already checked above)
+            non_rate_missing = missing[~is_rate_row].sum()
+            for col, count in non_rate_missing[non_rate_missing > 0].items():
+                issues.append(Issue(
+                    severity='warning',
+                    category='missing_data',
+                    message=f'Missing values in column {col}: {count} values'
+                ))
 
         if not issues:
             logger.debug("No missing values found")
 
         return issues
 
-    def check_negative_values(self, data: pd.DataFrame) -> List[Dict[str, str]]:
+    def check_negative_values(self, data: pd.DataFrame) -> List[Issue]:
         """
         Check for negative values in amount fields where they shouldn't exist.
 
@@ -164,12 +291,25 @@ class ValidationService:
             data: DataFrame with dashboard data
 
         Returns:
-            List of issue dictionaries
+            List of Issue objects
         """
-        issues = []
+        # Get KPI names from 'month' column (first column)
+        if data.empty or 'month' not in data.columns:
+            return []
 
-        if data.empty:
-            return issues
+        return self._check_negative_values(_index_by_kpi(data))
+
+    def _check_negative_values(self, kpi_rows: pd.DataFrame) -> List[Issue]:
+        """
+        Check KPI-indexed rows for negative or non-numeric amounts.
+
+        Args:
+            kpi_rows: Dashboard data indexed by KPI name (see _index_by_kpi)
+
+        Returns:
+            List of Issue objects
+        """
+        issues = []
 
         # Fields that should not have negative values
         positive_only_fields = [
@@ -177,50 +317,42 @@ class ValidationService:
             'USD/EUR Rate'
         ]
 
-        # Get KPI names from 'month' column (first column)
-        if 'month' not in data.columns:
+        # Rows of the positive-only KPIs present, in the order listed above
+        present_fields = [field for field in positive_only_fields if field in kpi_rows.index]
+        if not present_fields:
             return issues
 
-        for field in positive_only_fields:
-            # Find row for this KPI
-            kpi_row = data[data['month'] == field]
-
-            if kpi_row.empty:
-                continue
-
-            # Check all period columns for negative values
-            period_columns = [col for col in data.columns if col != 'month']
-
-            for col in period_columns:
-                value = kpi_row[col].values[0]
-
-                # Skip NaN values
-                if pd.isna(value):
-                    continue
-
-                # Check if value is numeric and negative
-                try:
-                    numeric_value = float(value)
-                    if numeric_value < 0:
-                        issues.append({
-                            'severity': 'warning',
-                            'category': 'negative_values',
-                            'message': f'Negative value for {field} in {col}: {numeric_value}'
-                        })
-                except (ValueError, TypeError):
-                    # Non-numeric value
-                    issues.append({
-                        'severity': 'warning',
-                        'category': 'data_type',
-                        'message': f'Non-numeric value for {field} in {col}: {value}'
-                    })
+        kpi_rows = kpi_rows.loc[present_fields]
+        period_columns = list(kpi_rows.columns)
+
+        # Convert each period column once; values that fail to convert are non-numeric
+        numeric = kpi_rows.apply(pd.to_numeric, errors='coerce')
+        is_negative = numeric.lt(0).to_numpy(dtype=bool)
+        is_non_numeric = (numeric.isna() & kpi_rows.notna()).to_numpy(dtype=bool)
+
+        # np.nonzero walks row-major: KPI by KPI, then period by period
+        for row, col_idx in zip(*np.nonzero(is_negative | is_non_numeric)):
+            field = present_fields[row]
+            col = period_columns[col_idx]
+            if is_negative[row, col_idx]:
+                issues.append(Issue(
+                    severity='warning',
+                    category='negative_values',
+                    message=f'Negative value for {field} in {col}: {float(numeric.iat[row, col_idx])}'
+                ))
+            else:
+                issues.append(Issue(
+                    severity='warning',
+                    category='data_type',
+                    message=f'Non-numeric value for {field} in {col}: {kpi_rows.iat[row, col_idx]}'
+                ))
 
         if not issues:
             logger.debug("No negative value issues found")
 
         return issues
 
-    def check_period_continuity(self, data: pd.DataFrame) -> List[Dict[str, str]]:
+    def check_period_continuity(self, data: pd.DataFrame) -> List[Issue]:
         """
         Check for gaps or discontinuities in period columns.
 
@@ -228,7 +360,7 @@ class ValidationService:
             data: DataFrame with dashboard data
 
         Returns:
-            List of issue dictionaries
+            List of Issue objects
         """
         issues = []
 
@@ -239,71 +371,51 @@ class ValidationService:
         period_columns = [col for col in data.columns if col != 'month']
 
         if len(period_columns) < 2:
-            issues.append({
-                'severity': 'info',
-                'category': 'period_continuity',
-                'message': f'Only {len(period_columns)} period(s) found, cannot check continuity'
-            })
+            issues.append(Issue(
+                severity='info',
+                category='period_continuity',
+                message=f'Only {len(period_columns)} period(s) found, cannot check continuity'
+            ))
             return issues
 
-        # Expected format: "Jan-25", "Feb-25", etc.
-        # Check if periods follow expected monthly pattern
-        month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                       'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-
-        parsed_periods = []
-        for col in period_columns:
-            try:
-                # Expected format: "MMM-YY"
-                if '-' in col:
-                    month_part, year_part = col.split('-')
-                    if month_part in month_order:
-                        parsed_periods.append((month_part, year_part, col))
-                    else:
-                        issues.append({
-                            'severity': 'warning',
-                            'category': 'period_continuity',
-                            'message': f'Unrecognized month format: {col}'
-                        })
-                else:
-                    issues.append({
-                        'severity': 'warning',
-                        'category': 'period_continuity',
-                        'message': f'Period column does not match expected format (MMM-YY): {col}'
-                    })
-            except Exception as e:
-                issues.append({
-                    'severity': 'warning',
-                    'category': 'period_continuity',
-                    'message': f'Error parsing period column {col}: {str(e)}'
-                })
-
-        # Check for proper month sequence (allowing year transitions)
-        if len(parsed_periods) > 1:
-            for i in range(len(parsed_periods) - 1):
-                current_month, current_year, current_col = parsed_periods[i]
-                next_month, next_year, next_col = parsed_periods[i + 1]
-
-                current_idx = month_order.index(current_month)
-                next_idx = month_order.index(next_month)
-
-                # Check if months are consecutive
-                expected_next_idx = (current_idx + 1) % 12
-                expected_next_year = current_year if current_idx < 11 else str(int(current_year) + 1)
-
-                if next_idx != expected_next_idx or next_year != expected_next_year:
-                    issues.append({
-                        'severity': 'info',
-                        'category': 'period_continuity',
-                        'message': f'Non-consecutive periods: {current_col} -> {next_col}'
-                    })
+        # Expected format: "Jan-25", "Feb-25", etc. The precompiled pattern
+        # keeps month names case-sensitive, which strptime's %b is not
+        column_names = pd.Index(period_columns).astype(str)
+        is_invalid = np.array([not _is_period_header(col) for col in column_names], dtype=bool)
+        # Parse every valid header in one call
+        parsed = pd.to_datetime(column_names.where(~is_invalid), format='%b-%y', errors='coerce')
+
+        for col in column_names[is_invalid]:
+            if '-' in col:
+                message = f'Unrecognized month format: {col}'
+            else:
+                message = f'Period column does not match expected format (MMM-YY): {col}'
+            issues.append(Issue(
+                severity='warning',
+                category='period_continuity',
+                message=message
+            ))
+
+        # Check for proper month sequence (allowing year transitions):
+        # consecutive periods are exactly one month apart
+        valid_columns = column_names[~is_invalid]
+        valid_periods = parsed[~is_invalid]
+        month_numbers = (valid_periods.year * 12 + valid_periods.month).to_numpy()
+        breaks = (month_numbers[1:] - month_numbers[:-1]) != 1
+
+        for i in breaks.nonzero()[0]:
+            issues.append(Issue(
+                severity='info',
+                category='period_continuity',
+                message=f'Non-consecutive periods: {valid_columns[i]} -> {valid_columns[i + 1]}'
+            ))
 
         if not issues:
             logger.debug("No period continuity issues found")
 
         return issues
 
-    def check_currency_rates(self, data: pd.DataFrame) -> List[Dict[str, str]]:
+    def check_currency_rates(self, data: pd.DataFrame) -> List[Issue]:
         """
         Check currency rates for validity (reasonable ranges).
 
@@ -311,97 +423,108 @@ class ValidationService:
             data: DataFrame with dashboard data
 
         Returns:
-            List of issue dictionaries
+            List of Issue objects
         """
-        issues = []
-
         if data.empty or 'month' not in data.columns:
-            return issues
+            return []
+
+        return self._check_currency_rates(_index_by_kpi(data))
+
+    def _check_currency_rates(self, kpi_rows: pd.DataFrame) -> List[Issue]:
+        """
+        Check the USD/EUR rate row of KPI-indexed data.
+
+        Args:
+            kpi_rows: Dashboard data indexed by KPI name (see _index_by_kpi)
+
+        Returns:
+            List of Issue objects
+        """
+        issues = []
 
         # Find USD/EUR rate row
-        rate_row = data[data['month'] == 'USD/EUR Rate']
-
-        if rate_row.empty:
-            issues.append({
-                'severity': 'critical',
-                'category': 'currency_rates',
-                'message': 'USD/EUR Rate row not found in data'
-            })
+        if 'USD/EUR Rate' not in kpi_rows.index:
+            issues.append(Issue(
+                severity='critical',
+                category='currency_rates',
+                message='USD/EUR Rate row not found in data'
+            ))
             return issues
 
         # Check all period columns
-        period_columns = [col for col in data.columns if col != 'month']
+        rates = kpi_rows.loc['USD/EUR Rate']
 
         # Reasonable range for USD/EUR rate (last 10 years: ~0.7 to ~1.3)
         MIN_RATE = 0.7
         MAX_RATE = 1.3
 
-        for col in period_columns:
-            value = rate_row[col].values[0]
-
-            # Skip NaN values (already caught by missing values check)
-            if pd.isna(value):
+        # Convert the row once and evaluate every rule as a numpy mask;
+        # NaN values never match (already caught by missing values check)
+        numeric = pd.to_numeric(rates, errors='coerce')
+        values = numeric.to_numpy(dtype=float)
+        is_non_numeric = (numeric.isna() & rates.notna()).to_numpy()
+        is_out_of_range = (values < MIN_RATE) | (values > MAX_RATE)
+        is_zero = values == 0
+        is_one = values == 1.0
+
+        # Only flagged periods reach Python, in column order
+        for i in np.flatnonzero(is_non_numeric | is_out_of_range | is_zero | is_one):
+            col = rates.index[i]
+            if is_non_numeric[i]:
+                issues.append(Issue(
+                    severity='critical',
+                    category='currency_rates',
+                    message=f'Non-numeric currency rate in {col}: {rates.iloc[i]}'
+                ))
                 continue
 
-            try:
-                numeric_value = float(value)
-
-                # Check if rate is in reasonable range
-                if numeric_value < MIN_RATE or numeric_value > MAX_RATE:
-                    issues.append({
-                        'severity': 'warning',
-                        'category': 'currency_rates',
-                        'message': f'USD/EUR rate out of expected range ({MIN_RATE}-{MAX_RATE}) in {col}: {numeric_value}'
-                    })
-
-                # Check if rate is exactly 0 or 1 (likely error)
-                if numeric_value == 0:
-                    issues.append({
-                        'severity': 'critical',
-                        'category': 'currency_rates',
-                        'message': f'USD/EUR rate is zero in {col}'
-                    })
-                elif numeric_value == 1.0:
-                    issues.append({
-                        'severity': 'info',
-                        'category': 'currency_rates',
-                        'message': f'USD/EUR rate is exactly 1.0 in {col} (verify if correct)'
-                    })
-
-            except (ValueError, TypeError):
-                issues.append({
-                    'severity': 'critical',
-                    'category': 'currency_rates',
-                    'message': f'Non-numeric currency rate in {col}: {value}'
-                })
+            numeric_value = float(values[i])
+
+            # Check if rate is in reasonable range
+            if is_out_of_range[i]:
+                issues.append(Issue(
+                    severity='warning',
+                    category='currency_rates',
+                    message=f'USD/EUR rate out of expected range ({MIN_RATE}-{MAX_RATE}) in {col}: {numeric_value}'
+                ))
+
+            # Check if rate is exactly 0 or 1 (likely error)
+            if is_zero[i]:
+                issues.append(Issue(
+                    severity='critical',
+                    category='currency_rates',
+                    message=f'USD/EUR rate is zero in {col}'
+                ))
+            elif is_one[i]:
+                issues.append(Issue(
+                    severity='info',
+                    category='currency_rates',
+                    message=f'USD/EUR rate is exactly 1.0 in {col} (verify if correct)'
+                ))
 
         if not issues:
             logger.debug("No currency rate issues found")
 
         return issues
 
-    def categorize_issues(self, issues: List[Dict[str, str]]) -> Dict[str, int]:
+    def categorize_issues(self, issues: List[Issue]) -> Dict[str, int]:
         """
         Categorize issues by severity level.
 
         Args:
-            issues: List of issue dictionaries with 'severity' key
+            issues: List of Issue objects
 
         Returns:
             dict: Count of issues by severity {'critical': 0, 'warning': 2, 'info': 1}
         """
-        summary = {
-            'critical': 0,
-            'warning': 0,
-            'info': 0
-        }
-
-        for issue in issues:
-            severity = issue.get('severity', 'info')
-            if severity in summary:
-                summary[severity] += 1
+        counts = Counter(issue.severity for issue in issues)
 
-        return summary
+        # Unknown severities are ignored; known ones always appear
+        return {
+            'critical': counts['critical'],
+            'warning': counts['warning'],
+            'info': counts['info']
+        }
 
     def save_validation_report(self, report: Dict[str, Any]) -> ValidationReport:
         """
@@ -417,12 +540,7 @@ class ValidationService:
             DashboardError: If database operation fails
         """
         try:
-            validation_report = ValidationReport(
-                status=report['status'],
-                summary=json.dumps(report['summary']),
-                issues=json.dumps(report['issues']),
-                data_file=report.get('data_file')
-            )
+            validation_report = self._build_report_model(report)
 
             self.db_session.add(validation_report)
             self.db_session.commit()
@@ -436,6 +554,43 @@ class ValidationService:
             logger.error(f"Failed to save validation report: {e}")
             raise DashboardError(f'Failed to save validation report: {str(e)}')
 
+    def save_validation_reports(self, reports: List[Dict[str, Any]]) -> List[ValidationReport]:
+        """
+        Save several validation reports in a single transaction.
+
+        Args:
+            reports: Validation report dictionaries from validate_data_quality
+
+        Returns:
+            List of saved ValidationReport objects, in the same order as reports
+
+        Raises:
+            DashboardError: If database operation fails
+        """
+        try:
+            validation_reports = [self._build_report_model(report) for report in reports]
+
+            # One flush and one commit for the whole batch
+            self.db_session.add_all(validation_reports)
+            self.db_session.commit()
+
+            logger.info(f"Saved {len(validation_reports)} validation reports")
+            return validation_reports
+
+        except Exception as e:
+            self.db_session.rollback()
+            logger.error(f"Failed to save validation reports: {e}")
+            raise DashboardError(f'Failed to save validation reports: {str(e)}')
+
+    def _build_report_model(self, report: Dict[str, Any]) -> ValidationReport:
+        """Create an unsaved ValidationReport row from a report dictionary."""
+        return ValidationReport(
+            status=report['status'],
+            summary=json.dumps(report['summary']),
+            issues=json.dumps(report['issues']),
+            data_file=report.get('data_file')
+        )
+
     def get_validation_reports(
         self,
         limit: int = 10,
@@ -464,7 +619,12 @@ class ValidationService:
                 query = query.filter(ValidationReport.status == status_filter)
 
             # Order by timestamp (most recent first) and limit
-            reports = query.order_by(ValidationReport.timestamp.desc()).limit(limit).all()
+            # id breaks ties between reports saved in the same batch
+            reports = (
+                query.order_by(ValidationReport.timestamp.desc(), ValidationReport.id.desc())
+                .limit(limit)
+                .all()
+            )
 
             logger.debug(f"Retrieved {len(reports)} validation reports")
             return reports
@@ -488,7 +648,7 @@ class ValidationService:
         try:
             report = (
                 self.db_session.query(ValidationReport)
-                .order_by(ValidationReport.timestamp.desc())
+                .order_by(ValidationReport.timestamp.desc(), ValidationReport.id.desc())
                 .first()
             )
 
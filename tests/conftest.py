@@ -4,13 +4,45 @@ Shared pytest fixtures and configuration for all tests.
 This module provides common fixtures that can be used across all test files.
 """
 import pytest
+import numpy as np
 import pandas as pd
 import json
 import os
+import random
+import sys
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import Mock, MagicMock
 
+# Make the project root importable (scripts/, data_pipeline.py) for every test module
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+
+def pytest_addoption(parser):
+    """Register command-line options for the test suite."""
+    parser.addoption(
+        '--reuse-db',
+        action='store_true',
+        default=False,
+        help='Keep file-backed test databases between runs and skip schema creation when present'
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def precreate_logs_dir():
+    """Create the project logs/ directory once for the whole test session."""
+    (Path(__file__).parent.parent / 'logs').mkdir(exist_ok=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def seed_random():
+    """Seed the stdlib and NumPy RNGs once for a deterministic test session."""
+    random.seed(0)
+    np.random.seed(0)
+    yield
+
 
 @pytest.fixture
 def sample_kpi_data():
@@ -92,13 +124,16 @@ def mock_google_sheets_service():
         ]
     }
 
-    # Mock sheet values
-    mock_service.spreadsheets().values().get().execute.return_value = {
-        'values': [
-            ['month', 'Jan-25', 'Feb-25'],
-            ['GMV', '11352846', '12500000'],
-            ['Funded Amount', '10107543', '11200000']
-        ]
+    # Mock sheet values (single batchGet round-trip)
+    mock_service.spreadsheets().values().batchGet().execute.return_value = {
+        'valueRanges': [{
+            'range': 'dashboard!A1:Z3',
+            'values': [
+                ['month', 'Jan-25', 'Feb-25'],
+                ['GMV', '11352846', '12500000'],
+                ['Funded Amount', '10107543', '11200000']
+            ]
+        }]
     }
 
     return mock_service
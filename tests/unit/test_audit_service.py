@@ -20,10 +20,13 @@ from scripts.models.audit_log import AuditLog
 from scripts.exceptions import DashboardError
 from scripts.auth import hash_password
 
+# Shared factory; expire_on_commit=False avoids reloading rows after each commit
+TestSessionFactory = sessionmaker(expire_on_commit=False)
 
-@pytest.fixture
-def test_db_session():
-    """Create an in-memory SQLite database session for testing."""
+
+@pytest.fixture(scope="module")
+def test_engine():
+    """Create an in-memory SQLite database with all tables, once per module."""
     # Import all models to register them with Base.metadata
     from scripts.models.user import User
     from scripts.models.audit_log import AuditLog
@@ -31,13 +34,24 @@ def test_db_session():
 
     engine = create_engine('sqlite:///:memory:', echo=False)
     Base.metadata.create_all(engine)
-    TestSessionFactory = sessionmaker(bind=engine)
-    session = TestSessionFactory()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def test_db_session(test_engine):
+    """Create a database session that empties every table after the test."""
+    session = TestSessionFactory(bind=test_engine)
 
     yield session
 
+    session.rollback()
+    for table in reversed(Base.metadata.sorted_tables):
+        session.execute(table.delete())
+    session.commit()
     session.close()
-    Base.metadata.drop_all(engine)
 
 
 @pytest.fixture
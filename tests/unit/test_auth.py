@@ -28,31 +28,47 @@ from scripts.constants import (
 )
 
 
+# Built once; each test's session is bound to the module engine.
+# Objects stay loaded after commit, so reading attributes does not re-SELECT.
+TestSessionFactory = sessionmaker(expire_on_commit=False)
+
+
 # Task 24: Test fixtures for database and users
 
-@pytest.fixture
-def test_db_session():
+@pytest.fixture(scope="module")
+def test_engine():
     """
-    Create an in-memory SQLite database session for testing.
+    Create an in-memory SQLite database with all tables, once per module.
 
-    Creates a fresh database with all tables for each test,
-    and automatically cleans up after the test completes.
+    SQLite keeps a ``:memory:`` database alive on the engine's pooled
+    connection, so the schema survives until the engine is disposed.
     """
-    # Create in-memory SQLite database
     engine = create_engine('sqlite:///:memory:', echo=False)
-
-    # Create all tables
     Base.metadata.create_all(engine)
 
-    # Create session factory
-    TestSessionFactory = sessionmaker(bind=engine)
-    session = TestSessionFactory()
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def test_db_session(test_engine):
+    """
+    Create a database session for testing.
+
+    Reuses the module's schema and empties every table after the test
+    completes, which is much cheaper than dropping and recreating it.
+    """
+    session = TestSessionFactory(bind=test_engine)
 
     yield session
 
-    # Cleanup
+    # Cleanup: delete children before parents
+    session.rollback()
+    for table in reversed(Base.metadata.sorted_tables):
+        session.execute(table.delete())
+    session.commit()
     session.close()
-    Base.metadata.drop_all(engine)
 
 
 @pytest.fixture
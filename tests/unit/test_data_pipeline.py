@@ -14,10 +14,6 @@ import pandas as pd
 import json
 from pathlib import Path
 from datetime import datetime
-import sys
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from data_pipeline import KPIPipeline
 
@@ -15,11 +15,8 @@ import json
 import os
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch, mock_open
-import sys
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import scripts.fetch_from_sheets as fetch_module
 from scripts.fetch_from_sheets import (
     get_credentials,
     convert_to_dataframe,
@@ -38,12 +35,7 @@ class TestCredentialLoading:
         """Test that FileNotFoundError is raised when credentials file doesn't exist."""
         # Set environment variable to non-existent file
         fake_path = str(tmp_path / "nonexistent.json")
-        monkeypatch.setenv('GOOGLE_CREDENTIALS_FILE', fake_path)
-
-        # Need to reload the module to pick up the new env var
-        import importlib
-        import scripts.fetch_from_sheets as fetch_module
-        importlib.reload(fetch_module)
+        monkeypatch.setattr(fetch_module, 'CREDENTIALS_FILE', fake_path)
 
         with pytest.raises(FileNotFoundError) as exc_info:
             fetch_module.get_credentials()
@@ -54,13 +46,8 @@ class TestCredentialLoading:
     @patch('scripts.fetch_from_sheets.service_account.Credentials.from_service_account_file')
     def test_get_credentials_success(self, mock_creds, sample_credentials_file, monkeypatch):
         """Test successful credential loading."""
-        # Set environment variable
-        monkeypatch.setenv('GOOGLE_CREDENTIALS_FILE', sample_credentials_file)
-
-        # Reload module to pick up env var
-        import importlib
-        import scripts.fetch_from_sheets as fetch_module
-        importlib.reload(fetch_module)
+        # Point the module at the sample credentials file
+        monkeypatch.setattr(fetch_module, 'CREDENTIALS_FILE', sample_credentials_file)
 
         # Mock successful credential creation
         mock_creds.return_value = Mock()
@@ -70,6 +57,56 @@ class TestCredentialLoading:
         mock_creds.assert_called_once()
         assert result is not None
 
+    @pytest.mark.unit
+    def test_main_credentials_file_does_not_change_module_default(self, tmp_path, monkeypatch):
+        """Test that main(credentials_file=...) is used for that run only."""
+        missing_path = str(tmp_path / "missing.json")
+        default_path = fetch_module.CREDENTIALS_FILE
+        monkeypatch.setattr(fetch_module, 'fetch_sheet_data', Mock(side_effect=ValueError('not a sheet')))
+
+        with pytest.raises(fetch_module.CredentialsError, match='missing.json'):
+            fetch_module.main('test_file_id', credentials_file=missing_path)
+
+        assert fetch_module.CREDENTIALS_FILE == default_path
+
+
+class TestSheetsFetching:
+    """Tests for reading sheet values through the Sheets API."""
+
+    @pytest.mark.unit
+    def test_fetch_sheet_data_single_round_trip(self, mock_google_sheets_service, monkeypatch):
+        """Test that sheet values are read with one batchGet and no metadata call."""
+        monkeypatch.setattr(fetch_module, 'get_sheets_service', lambda credentials_file=None: mock_google_sheets_service)
+        mock_google_sheets_service.reset_mock()
+
+        values = fetch_module.fetch_sheet_data('test_spreadsheet_id', 'dashboard')
+
+        assert values[0] == ['month', 'Jan-25', 'Feb-25']
+        mock_google_sheets_service.spreadsheets().values().batchGet.assert_called_once_with(
+            spreadsheetId='test_spreadsheet_id',
+            ranges=['dashboard!A:Z']
+        )
+        mock_google_sheets_service.spreadsheets().get.assert_not_called()
+
+    @pytest.mark.unit
+    def test_fetch_sheet_data_falls_back_to_first_sheet(self, mock_google_sheets_service, monkeypatch):
+        """Test that an unreadable sheet name falls back to the first available sheet."""
+        from googleapiclient.errors import HttpError
+
+        monkeypatch.setattr(fetch_module, 'get_sheets_service', lambda credentials_file=None: mock_google_sheets_service)
+        batch_get = mock_google_sheets_service.spreadsheets().values().batchGet
+        good_response = batch_get().execute.return_value
+        batch_get.reset_mock()
+        batch_get.return_value.execute.side_effect = [
+            HttpError(Mock(status=400), b'Unable to parse range'),
+            good_response
+        ]
+
+        values = fetch_module.fetch_sheet_data('test_spreadsheet_id', 'missing')
+
+        assert values[0] == ['month', 'Jan-25', 'Feb-25']
+        assert batch_get.call_args.kwargs['ranges'] == ['dashboard!A:Z']
+
 
 class TestDataFrameConversion:
     """Tests for converting Google Sheets data to pandas DataFrames."""
@@ -271,6 +308,31 @@ class TestDashboardJsonPreparation:
         assert result['values_eur']['GMV'][1] is None
 
 
+@pytest.fixture(scope="module")
+def shared_config_dir(tmp_path_factory):
+    """Module-wide directory holding a read-only config.json that excludes Feb-25."""
+    config_dir = tmp_path_factory.mktemp("cfg")
+    (config_dir / "config.json").write_text(
+        '{"data_settings": {"exclude_periods": ["Feb-25"]}}'
+    )
+    return config_dir
+
+
+@pytest.fixture(scope="module")
+def empty_config_dir(tmp_path_factory):
+    """Module-wide directory without a config.json."""
+    return tmp_path_factory.mktemp("no_cfg")
+
+
+@pytest.fixture
+def clear_config_cache():
+    """Reset the load_config cache so each test reads its own config.json."""
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
+
+
+@pytest.mark.usefixtures('clear_config_cache')
 class TestConfigLoading:
     """Tests for configuration file loading."""
 
@@ -287,34 +349,52 @@ class TestConfigLoading:
         assert result['google_drive_file_id'] == 'test_file_id_123'
 
     @pytest.mark.unit
-    def test_load_config_file_not_exists(self, tmp_path, monkeypatch):
+    def test_load_config_file_not_exists(self, empty_config_dir, monkeypatch):
         """Test loading when config file doesn't exist."""
         # Change to empty temp directory
-        monkeypatch.chdir(tmp_path)
+        monkeypatch.chdir(empty_config_dir)
 
         result = load_config()
 
         assert result is None
 
+    @pytest.mark.unit
+    def test_load_config_from_base_dir(self, sample_config_file, empty_config_dir, monkeypatch):
+        """Test that base_dir locates config.json independently of the working directory."""
+        monkeypatch.chdir(empty_config_dir)
+
+        result = load_config(str(Path(sample_config_file).parent))
+
+        assert result['google_drive_file_id'] == 'test_file_id_123'
+
+    @pytest.mark.unit
+    def test_load_config_is_cached(self, sample_config_file, monkeypatch):
+        """Test that repeated loads reuse the parsed config until the file changes."""
+        monkeypatch.chdir(Path(sample_config_file).parent)
+
+        first = load_config()
+        second = load_config()
+
+        assert first is second
+
+        # Rewriting the file bumps its mtime and invalidates the cached entry
+        stat = os.stat(sample_config_file)
+        with open(sample_config_file, 'w') as f:
+            json.dump({'google_drive_file_id': 'changed'}, f)
+        os.utime(sample_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_config()['google_drive_file_id'] == 'changed'
 
+
+@pytest.mark.usefixtures('clear_config_cache')
 class TestPeriodFiltering:
     """Tests for period filtering in dashboard JSON preparation."""
 
     @pytest.mark.unit
-    def test_prepare_dashboard_json_with_exclusions(self, monkeypatch, tmp_path):
+    def test_prepare_dashboard_json_with_exclusions(self, monkeypatch, shared_config_dir):
         """Test that excluded periods are filtered out."""
-        # Create config with exclusions
-        config_data = {
-            "data_settings": {
-                "exclude_periods": ["Feb-25"]
-            }
-        }
-
-        config_file = tmp_path / "config.json"
-        with open(config_file, 'w') as f:
-            json.dump(config_data, f)
-
-        monkeypatch.chdir(tmp_path)
+        # Config in shared_config_dir excludes Feb-25
+        monkeypatch.chdir(shared_config_dir)
 
         df_usd = pd.DataFrame({
             'month': ['GMV'],
@@ -339,3 +419,22 @@ class TestPeriodFiltering:
 
         # Values should only have 2 entries (Jan and Mar)
         assert len(result['values_usd']['GMV']) == 2
+
+    @pytest.mark.unit
+    def test_main_applies_exclusions_from_base_dir(self, tmp_path, empty_config_dir, monkeypatch):
+        """Test that main(base_dir=...) filters periods with that directory's config.json."""
+        (tmp_path / "config.json").write_text('{"data_settings": {"exclude_periods": ["Feb-25"]}}')
+        (tmp_path / "data" / "processed").mkdir(parents=True)
+        monkeypatch.chdir(empty_config_dir)
+        monkeypatch.setattr(fetch_module, 'fetch_sheet_data', lambda *args: [
+            ['month', 'Jan-25', 'Feb-25'],
+            ['GMV', '1000000', '1100000'],
+            ['USD/EUR Rate', '0.92', '0.93']
+        ])
+
+        output_path = fetch_module.main('test_file_id', base_dir=str(tmp_path))
+
+        with open(output_path) as f:
+            result = json.load(f)
+        assert output_path == str(tmp_path / fetch_module.OUTPUT_JSON)
+        assert result['periods'] == ['Jan-25']
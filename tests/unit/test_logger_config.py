@@ -11,12 +11,10 @@ Tests cover:
 import pytest
 import logging
 import os
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
-import sys
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from scripts import logger_config
 from scripts.logger_config import get_logger, set_log_level, log_environment_info
 
 
@@ -80,22 +78,23 @@ class TestLogHandlers:
         """Test that logger has console (StreamHandler) configured."""
         logger = get_logger('test_console_handler')
 
-        # Find console handler
-        console_handlers = [h for h in logger.handlers if isinstance(h, logging.StreamHandler)
-                          and not isinstance(h, logging.FileHandler)]
+        console_handler = logger._handler_index['console']
 
-        assert len(console_handlers) > 0
+        assert console_handler in logger.handlers
+        assert isinstance(console_handler, logging.StreamHandler)
+        assert not isinstance(console_handler, logging.FileHandler)
 
     @pytest.mark.unit
     def test_logger_has_file_handler(self):
         """Test that logger has file (RotatingFileHandler) configured."""
         logger = get_logger('test_file_handler')
 
-        # Find file handler
-        from logging.handlers import RotatingFileHandler
-        file_handlers = [h for h in logger.handlers if isinstance(h, RotatingFileHandler)]
+        file_handler = logger._handler_index['file']
 
-        assert len(file_handlers) > 0
+        # File writes go through the shared queue listener, not the logger itself
+        assert logger._handler_index['queue'] in logger.handlers
+        assert file_handler in logger_config._queue_listener.handlers
+        assert isinstance(file_handler, RotatingFileHandler)
 
     @pytest.mark.unit
     def test_file_handler_creates_log_directory(self):
@@ -107,56 +106,35 @@ class TestLogHandlers:
         assert log_dir.exists()
 
     @pytest.mark.unit
-    def test_console_handler_level_info(self):
-        """Test that console handler is set to INFO level."""
-        logger = get_logger('test_console_level')
-
-        console_handlers = [h for h in logger.handlers if isinstance(h, logging.StreamHandler)
-                          and not isinstance(h, logging.FileHandler)]
+    @pytest.mark.parametrize('role,expected_level', [
+        ('console', logging.INFO),
+        ('file', logging.DEBUG),
+    ])
+    def test_handler_levels(self, role, expected_level):
+        """Test that console handler is INFO and file handler is DEBUG."""
+        logger = get_logger('test_handler_levels')
 
-        if console_handlers:
-            assert console_handlers[0].level == logging.INFO
-
-    @pytest.mark.unit
-    def test_file_handler_level_debug(self):
-        """Test that file handler is set to DEBUG level."""
-        logger = get_logger('test_file_level')
+        handler = logger._handler_index[role]
 
-        from logging.handlers import RotatingFileHandler
-        file_handlers = [h for h in logger.handlers if isinstance(h, RotatingFileHandler)]
-
-        if file_handlers:
-            assert file_handlers[0].level == logging.DEBUG
+        assert handler.level == expected_level
 
 
 class TestLogFormatting:
     """Tests for log message formatting."""
 
     @pytest.mark.unit
-    def test_console_formatter_has_timestamp(self):
-        """Test that console formatter includes timestamp."""
-        logger = get_logger('test_console_format')
-
-        console_handlers = [h for h in logger.handlers if isinstance(h, logging.StreamHandler)
-                          and not isinstance(h, logging.FileHandler)]
-
-        if console_handlers:
-            formatter = console_handlers[0].formatter
-            assert '%(asctime)s' in formatter._fmt
-
-    @pytest.mark.unit
-    def test_file_formatter_has_detailed_info(self):
-        """Test that file formatter includes detailed information."""
-        logger = get_logger('test_file_format')
+    @pytest.mark.parametrize('role,token', [
+        ('console', '%(asctime)s'),
+        ('file', '%(funcName)s'),
+        ('file', '%(lineno)d'),
+    ])
+    def test_formatter_includes_token(self, role, token):
+        """Test that console output is timestamped and file output has call-site details."""
+        logger = get_logger('test_formatting')
 
-        from logging.handlers import RotatingFileHandler
-        file_handlers = [h for h in logger.handlers if isinstance(h, RotatingFileHandler)]
+        handler = logger._handler_index[role]
 
-        if file_handlers:
-            formatter = file_handlers[0].formatter
-            # Should have function name and line number
-            assert '%(funcName)s' in formatter._fmt
-            assert '%(lineno)d' in formatter._fmt
+        assert token in handler.formatter._fmt
 
 
 class TestSetLogLevel:
@@ -174,17 +152,18 @@ class TestSetLogLevel:
         assert logger.level != initial_level
 
     @pytest.mark.unit
-    def test_set_log_level_case_insensitive(self):
+    @pytest.mark.parametrize('level,expected', [
+        ('debug', logging.DEBUG),
+        ('WARNING', logging.WARNING),
+        ('Error', logging.ERROR),
+    ])
+    def test_set_log_level_case_insensitive(self, level, expected):
         """Test that set_log_level handles case-insensitive input."""
         logger = get_logger('test_set_level_case')
 
-        set_log_level(logger, 'debug')
+        set_log_level(logger, level)
 
-        assert logger.level == logging.DEBUG
-
-        set_log_level(logger, 'WARNING')
-
-        assert logger.level == logging.WARNING
+        assert logger.level == expected
 
 
 class TestEnvironmentInfoLogging:
@@ -273,12 +252,8 @@ class TestLogRotation:
         """Test that file handler is configured for rotation."""
         logger = get_logger('test_rotation')
 
-        from logging.handlers import RotatingFileHandler
-        file_handlers = [h for h in logger.handlers if isinstance(h, RotatingFileHandler)]
-
-        assert len(file_handlers) > 0
+        handler = logger._handler_index['file']
 
         # Check rotation settings
-        handler = file_handlers[0]
         assert handler.maxBytes > 0  # Should have max bytes set
         assert handler.backupCount > 0  # Should keep backups
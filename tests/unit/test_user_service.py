@@ -8,50 +8,195 @@ Tests cover:
 - Soft deletion
 - User listing with filters
 """
+import logging
+import os
+
+import bcrypt
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert, select
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from scripts.user_service import UserService
 from scripts.database import Base
 from scripts.models.user import User
 from scripts.exceptions import ValidationError, DashboardError
 
+# Keep SQLAlchemy's per-statement logging off regardless of the root log level
+logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
+logging.getLogger('sqlalchemy.pool').setLevel(logging.WARNING)
 
-@pytest.fixture
-def test_db_session():
-    """Create an in-memory SQLite database session for testing."""
-    engine = create_engine('sqlite:///:memory:', echo=False)
+# Named in-memory database shared by every connection in this process.
+# The name is unique per pytest-xdist worker so parallel runs never collide.
+_XDIST_WORKER = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+TEST_DATABASE_URL = (
+    f'sqlite:///file:almacena_{_XDIST_WORKER}?mode=memory&cache=shared&uri=true'
+)
+
+# Sessions join the test's outer transaction and commit to SAVEPOINTs.
+# Objects stay loaded after commit, so reading attributes does not re-SELECT.
+TestSessionFactory = sessionmaker(join_transaction_mode='create_savepoint', expire_on_commit=False)
+
+
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    """Let SQLAlchemy own BEGIN/SAVEPOINT instead of the pysqlite driver."""
+    dbapi_connection.isolation_level = None
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Test-only: skip SQLite's journal and fsync work entirely."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=MEMORY')
+    cursor.execute('PRAGMA synchronous=OFF')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.close()
+
+
+def _emit_begin(connection):
+    """Emit BEGIN explicitly since pysqlite no longer does it for us."""
+    connection.exec_driver_sql('BEGIN')
+
+
+@pytest.fixture(scope="session")
+def precomputed_hash():
+    """Single bcrypt hash shared by fixture users that never log in."""
+    return bcrypt.hashpw(b'FixturePass123!', bcrypt.gensalt(rounds=4)).decode('utf-8')
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hashing(monkeypatch):
+    """Use the minimum bcrypt cost (test-only) so hashing doesn't dominate runtime."""
+    monkeypatch.setattr('scripts.auth.BCRYPT_ROUNDS', 4)
+
+
+@pytest.fixture(scope="session")
+def test_engine():
+    """
+    Create the in-memory SQLite engine and schema once per test session.
+
+    StaticPool hands out the same DBAPI connection on every checkout, so
+    the in-memory database and its pragmas stay warm for the whole run.
+    """
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={'check_same_thread': False},
+        query_cache_size=1200
+    )
+    event.listen(engine, 'connect', _disable_pysqlite_transactions)
+    event.listen(engine, 'connect', _set_sqlite_pragmas)
+    event.listen(engine, 'begin', _emit_begin)
     Base.metadata.create_all(engine)
-    TestSessionFactory = sessionmaker(bind=engine)
-    session = TestSessionFactory()
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def test_connection(test_engine):
+    """Single long-lived connection shared by all tests in the session."""
+    connection = test_engine.connect()
+
+    yield connection
+
+    connection.close()
+
+
+@pytest.fixture(scope="class")
+def class_transaction(test_connection):
+    """Outer transaction spanning one test class, rolled back when the class finishes."""
+    transaction = test_connection.begin()
+
+    yield transaction
+
+    transaction.rollback()
+
+
+@pytest.fixture(scope="class")
+def test_db_session(test_connection, class_transaction):
+    """
+    Create one database session per test class on the shared connection.
+
+    The session turns its own commits into nested SAVEPOINT releases, so
+    the per-test SAVEPOINT opened by ``test_savepoint`` can discard
+    everything a test wrote while keeping class-scoped fixture data intact.
+    """
+    session = TestSessionFactory(bind=test_connection)
 
     yield session
 
     session.close()
-    Base.metadata.drop_all(engine)
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def test_savepoint(test_connection, test_db_session):
+    """Roll back each test's changes and reset the shared session afterwards."""
+    savepoint = test_connection.begin_nested()
+
+    yield savepoint
+
+    # Closing expunges the identity map so the next test starts from the database
+    test_db_session.close()
+    savepoint.rollback()
+
+
+@pytest.fixture(scope="class")
 def user_service(test_db_session):
     """Create UserService instance with test database session."""
     return UserService(test_db_session)
 
 
-@pytest.fixture
-def sample_users(test_db_session, user_service):
-    """Create sample users for testing."""
-    users = [
-        user_service.create_user('admin@example.com', 'AdminPass123!', role='admin'),
-        user_service.create_user('editor@example.com', 'EditorPass123!', role='editor'),
-        user_service.create_user('viewer@example.com', 'ViewerPass123!', role='viewer'),
-        user_service.create_user('inactive@example.com', 'InactivePass123!', active=False)
+def _sample_user_rows(password_hash):
+    """Row dicts for the admin, editor, viewer and inactive viewer sample users."""
+    return [
+        {'email': 'admin@example.com', 'password_hash': password_hash, 'role': 'admin', 'active': True},
+        {'email': 'editor@example.com', 'password_hash': password_hash, 'role': 'editor', 'active': True},
+        {'email': 'viewer@example.com', 'password_hash': password_hash, 'role': 'viewer', 'active': True},
+        {'email': 'inactive@example.com', 'password_hash': password_hash, 'role': 'viewer', 'active': False}
     ]
+
+
+def _insert_sample_users(session, password_hash):
+    """Insert the sample users and return them ordered by id."""
+    # Core insert on the table skips ORM instance state and flush entirely
+    session.execute(insert(User.__table__), _sample_user_rows(password_hash))
+    session.commit()
+    return session.scalars(select(User).order_by(User.id)).all()
+
+
+def _quick_user(session, email, role, active, password_hash):
+    """Insert a single user row directly, skipping validation and hashing."""
+    session.execute(
+        insert(User).values(email=email, password_hash=password_hash, role=role, active=active)
+    )
+
+
+@pytest.fixture
+def sample_users(test_db_session, precomputed_hash):
+    """Create sample users for tests that modify them."""
+    return _insert_sample_users(test_db_session, precomputed_hash)
+
+
+@pytest.fixture(scope="class")
+def sample_users_shared(test_db_session, precomputed_hash):
+    """
+    Create sample users once per test class for read-only tests.
+
+    The rows live in the class transaction, so per-test rollbacks keep
+    them and they are discarded when the class finishes.
+    """
+    users = _insert_sample_users(test_db_session, precomputed_hash)
+    # Release the session's SAVEPOINT before per-test SAVEPOINTs nest inside it
+    test_db_session.close()
     return users
 
 
 # Task 28: Test create_user method
 
+@pytest.mark.slow_hash
 class TestCreateUser:
     """Test user creation functionality."""
 
@@ -87,25 +232,17 @@ class TestCreateUser:
         with pytest.raises(ValidationError, match='Email already exists'):
             user_service.create_user('test@example.com', 'AnotherPass123!')
 
-    def test_create_user_invalid_email(self, user_service):
-        """Test that invalid email format raises ValidationError."""
-        with pytest.raises(ValidationError, match='Invalid email format'):
-            user_service.create_user('invalid_email', 'TestPass123!')
-
-    def test_create_user_empty_email(self, user_service):
-        """Test that empty email raises ValidationError."""
-        with pytest.raises(ValidationError, match='Invalid email format'):
-            user_service.create_user('', 'TestPass123!')
-
-    def test_create_user_short_password(self, user_service):
-        """Test that password shorter than 8 characters fails."""
-        with pytest.raises(ValidationError, match='Password must be at least 8 characters'):
-            user_service.create_user('test@example.com', 'short')
-
-    def test_create_user_invalid_role(self, user_service):
-        """Test that invalid role raises ValidationError."""
-        with pytest.raises(ValidationError, match='Invalid role'):
-            user_service.create_user('test@example.com', 'TestPass123!', role='superuser')
+    @pytest.mark.parametrize('email,password,role,error', [
+        ('invalid_email', 'TestPass123!', 'viewer', 'Invalid email format'),
+        ('', 'TestPass123!', 'viewer', 'Invalid email format'),
+        ('user@localhost', 'TestPass123!', 'viewer', 'Invalid email format'),
+        ('test@example.com', 'short', 'viewer', 'Password must be at least 8 characters'),
+        ('test@example.com', 'TestPass123!', 'superuser', 'Invalid role'),
+    ], ids=['invalid_email', 'empty_email', 'email_without_tld', 'short_password', 'invalid_role'])
+    def test_create_user_validation_errors(self, user_service, email, password, role, error):
+        """Test that invalid email, short password and unknown role raise ValidationError."""
+        with pytest.raises(ValidationError, match=error):
+            user_service.create_user(email, password, role=role)
 
     def test_create_user_inactive(self, user_service):
         """Test creating inactive user."""
@@ -119,9 +256,9 @@ class TestCreateUser:
 class TestGetUserById:
     """Test user retrieval by ID."""
 
-    def test_get_user_by_id_exists(self, user_service, sample_users):
+    def test_get_user_by_id_exists(self, user_service, sample_users_shared):
         """Test retrieving existing user by ID."""
-        user_id = sample_users[0].id
+        user_id = sample_users_shared[0].id
         user = user_service.get_user_by_id(user_id)
 
         assert user is not None
@@ -140,7 +277,7 @@ class TestGetUserById:
 class TestGetUserByEmail:
     """Test user retrieval by email."""
 
-    def test_get_user_by_email_exists(self, user_service, sample_users):
+    def test_get_user_by_email_exists(self, user_service, sample_users_shared):
         """Test retrieving existing user by email."""
         user = user_service.get_user_by_email('editor@example.com')
 
@@ -154,7 +291,24 @@ class TestGetUserByEmail:
 
         assert user is None
 
-    def test_get_user_by_email_case_sensitive(self, user_service, sample_users):
+    def test_get_user_by_email_uses_lambda_statement(self, user_service, sample_users_shared):
+        """Test that email lookups are built with lambda_stmt."""
+        executed = []
+
+        def record_statement(orm_execute_state):
+            executed.append(orm_execute_state.statement)
+
+        event.listen(user_service.db_session, 'do_orm_execute', record_statement)
+        try:
+            user_service.get_user_by_email('admin@example.com')
+            user_service.get_user_by_email('editor@example.com')
+        finally:
+            event.remove(user_service.db_session, 'do_orm_execute', record_statement)
+
+        assert len(executed) == 2
+        assert all(isinstance(stmt, StatementLambdaElement) for stmt in executed)
+
+    def test_get_user_by_email_case_sensitive(self, user_service, sample_users_shared):
         """Test that email lookup is case-sensitive by default."""
         user = user_service.get_user_by_email('ADMIN@EXAMPLE.COM')
 
@@ -175,6 +329,7 @@ class TestUpdateUser:
 
         assert updated_user.email == 'newemail@example.com'
 
+    @pytest.mark.slow_hash
     def test_update_user_password(self, user_service, sample_users):
         """Test updating user password."""
         user_id = sample_users[0].id
@@ -263,12 +418,11 @@ class TestDeleteUser:
     def test_delete_user_persists_in_database(self, user_service, sample_users, test_db_session):
         """Test that soft deleted user still exists in database."""
         user_id = sample_users[0].id
-        user_service.delete_user(user_id)
+        deleted_user = user_service.delete_user(user_id)
 
-        # User should still be in database
-        user = test_db_session.query(User).filter(User.id == user_id).first()
-        assert user is not None
-        assert user.active is False
+        # refresh() re-SELECTs the row and raises if it no longer exists
+        test_db_session.refresh(deleted_user)
+        assert deleted_user.active is False
 
     def test_delete_user_not_found(self, user_service):
         """Test deleting non-existent user raises ValidationError."""
@@ -292,53 +446,26 @@ class TestDeleteUser:
 class TestListUsers:
     """Test user listing functionality."""
 
-    def test_list_users_all(self, user_service, sample_users):
-        """Test listing all users."""
-        users = user_service.list_users()
-
-        assert len(users) == 4
-        emails = [u.email for u in users]
-        assert 'admin@example.com' in emails
-        assert 'editor@example.com' in emails
-        assert 'viewer@example.com' in emails
-        assert 'inactive@example.com' in emails
-
-    def test_list_users_active_only(self, user_service, sample_users):
-        """Test listing only active users."""
-        users = user_service.list_users(active_only=True)
-
-        assert len(users) == 3
-        emails = [u.email for u in users]
-        assert 'inactive@example.com' not in emails
-
-    def test_list_users_by_role_admin(self, user_service, sample_users):
-        """Test listing users filtered by admin role."""
-        users = user_service.list_users(role='admin')
+    @pytest.mark.parametrize('filter_kwargs, expected_emails', [
+        ({}, {'admin@example.com', 'editor@example.com', 'viewer@example.com', 'inactive@example.com'}),
+        ({'active_only': True}, {'admin@example.com', 'editor@example.com', 'viewer@example.com'}),
+        ({'role': 'admin'}, {'admin@example.com'}),
+        ({'role': 'editor'}, {'editor@example.com'}),
+        # Active viewer + inactive user (default role is viewer)
+        ({'role': 'viewer'}, {'viewer@example.com', 'inactive@example.com'}),
+    ], ids=['all', 'active_only', 'role_admin', 'role_editor', 'role_viewer'])
+    def test_list_users_filters(self, user_service, sample_users_shared, filter_kwargs, expected_emails):
+        """Test list_users filters against the shared sample population."""
+        users = user_service.list_users(**filter_kwargs)
 
-        assert len(users) == 1
-        assert users[0].email == 'admin@example.com'
-
-    def test_list_users_by_role_editor(self, user_service, sample_users):
-        """Test listing users filtered by editor role."""
-        users = user_service.list_users(role='editor')
-
-        assert len(users) == 1
-        assert users[0].email == 'editor@example.com'
-
-    def test_list_users_by_role_viewer(self, user_service, sample_users):
-        """Test listing users filtered by viewer role."""
-        users = user_service.list_users(role='viewer')
-
-        # Should return 2 viewers: active viewer + inactive user (default role is viewer)
-        assert len(users) == 2
         emails = [u.email for u in users]
-        assert 'viewer@example.com' in emails
-        assert 'inactive@example.com' in emails
+        assert len(emails) == len(expected_emails)
+        assert set(emails) == expected_emails
 
-    def test_list_users_role_and_active(self, user_service, sample_users):
+    def test_list_users_role_and_active(self, user_service, sample_users_shared, test_db_session, precomputed_hash):
         """Test listing users with both role and active filters."""
         # Create an inactive admin
-        user_service.create_user('inactive_admin@example.com', 'Password123!', role='admin', active=False)
+        _quick_user(test_db_session, 'inactive_admin@example.com', 'admin', False, precomputed_hash)
 
         users = user_service.list_users(role='admin', active_only=True)
 
@@ -350,6 +477,10 @@ class TestListUsers:
         with pytest.raises(ValidationError, match='Invalid role'):
             user_service.list_users(role='superuser')
 
+
+class TestListUsersEmptyDatabase:
+    """Test user listing without any seeded users."""
+
     def test_list_users_empty_database(self, user_service):
         """Test listing users when database is empty."""
         users = user_service.list_users()
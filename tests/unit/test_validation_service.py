@@ -8,34 +8,135 @@ Tests cover:
 - Currency rate validation
 - Report storage and retrieval
 """
+import hashlib
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
 import pytest
 import pandas as pd
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
-from scripts.validation_service import ValidationService
+import scripts.validation_service as validation_module
+from scripts.validation_service import Issue, ValidationService
 from scripts.database import Base
+from scripts.models.user import User  # registers the table with Base.metadata
+from scripts.models.audit_log import AuditLog  # registers the table with Base.metadata
 from scripts.models.validation_report import ValidationReport
 from scripts.exceptions import ValidationError, DashboardError
 
+# Each pytest-xdist worker gets its own database file
+_XDIST_WORKER = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+
+# Sessions join the test's outer transaction and commit to SAVEPOINTs
+TestSessionFactory = sessionmaker(join_transaction_mode='create_savepoint')
+
+
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    """Let SQLAlchemy own BEGIN/SAVEPOINT instead of the pysqlite driver."""
+    dbapi_connection.isolation_level = None
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Test-only: skip SQLite's journal and fsync work entirely."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=MEMORY')
+    cursor.execute('PRAGMA synchronous=OFF')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.close()
+
+
+def _emit_begin(connection):
+    """Emit BEGIN explicitly since pysqlite no longer does it for us."""
+    connection.exec_driver_sql('BEGIN')
+
+
+def _create_test_engine(url, **kwargs):
+    """Create a SQLite engine with SAVEPOINT support and test pragmas."""
+    engine = create_engine(url, echo=False, **kwargs)
+    event.listen(engine, 'connect', _disable_pysqlite_transactions)
+    event.listen(engine, 'connect', _set_sqlite_pragmas)
+    event.listen(engine, 'begin', _emit_begin)
+    return engine
+
+
+def _schema_hash():
+    """Hash the SQLite DDL for Base.metadata so model changes are detected."""
+    dialect = sqlite.dialect()
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        ddl.extend(
+            str(CreateIndex(index).compile(dialect=dialect))
+            for index in sorted(table.indexes, key=lambda index: index.name)
+        )
+    return hashlib.sha256('\n'.join(ddl).encode('utf-8')).hexdigest()
+
+
+@pytest.fixture(scope="session")
+def test_engine(request, tmp_path_factory):
+    """
+    Create the file-backed SQLite engine and schema once per test session.
+
+    With ``--reuse-db`` the database file lives at a stable per-worker path
+    and ``create_all`` is skipped while the schema hash stored next to it
+    matches the models; otherwise the file is rebuilt. Tests roll back
+    everything they write, so a reused file stays empty.
+    """
+    reuse_db = request.config.getoption('--reuse-db')
+    if reuse_db:
+        db_dir = Path(tempfile.gettempdir()) / 'almacena_test_db'
+        db_dir.mkdir(exist_ok=True)
+    else:
+        db_dir = tmp_path_factory.mktemp('db')
+
+    db_path = db_dir / f'test_{_XDIST_WORKER}.db'
+    hash_path = db_path.with_suffix('.schema')
+    schema_hash = _schema_hash()
+    schema_current = (
+        reuse_db
+        and db_path.exists()
+        and hash_path.exists()
+        and hash_path.read_text() == schema_hash
+    )
+    if not schema_current:
+        # Stale or missing: start from an empty file with the current schema
+        db_path.unlink(missing_ok=True)
+
+    engine = _create_test_engine(f'sqlite:///{db_path}')
+    if not schema_current:
+        Base.metadata.create_all(engine)
+        hash_path.write_text(schema_hash)
+
+    yield engine
+
+    engine.dispose()
+
 
 @pytest.fixture
-def test_db_session():
-    """Create an in-memory SQLite database session for testing."""
-    # Import all models to register them with Base.metadata
-    from scripts.models.user import User
-    from scripts.models.audit_log import AuditLog
-    from scripts.models.validation_report import ValidationReport
-
-    engine = create_engine('sqlite:///:memory:', echo=False)
-    Base.metadata.create_all(engine)
-    TestSessionFactory = sessionmaker(bind=engine)
-    session = TestSessionFactory()
+def test_db_session(test_engine):
+    """
+    Create a database session whose changes are rolled back after each test.
+
+    The session joins an outer transaction on its own connection, and
+    commits made by the service (e.g. save_validation_report) only release
+    SAVEPOINTs inside it, so the final rollback discards everything.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = TestSessionFactory(bind=connection)
 
     yield session
 
     session.close()
-    Base.metadata.drop_all(engine)
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
@@ -44,9 +145,52 @@ def validation_service(test_db_session):
     return ValidationService(test_db_session)
 
 
-@pytest.fixture
-def valid_data():
-    """Create valid dashboard data for testing."""
+@pytest.fixture(scope="module")
+def seeded_service():
+    """
+    ValidationService over reports saved once per module, for read-only tests.
+
+    Uses its own in-memory database so the seeded rows never leak into
+    tests that expect an empty one.
+
+    The reports (file0.csv ... file4.csv) get explicit, distinct timestamps
+    whose order differs from their insertion (ID) order, so ordering tests
+    can only pass by sorting on timestamp.
+
+    Yields:
+        Tuple of (service, saved report IDs, most recent first)
+    """
+    engine = _create_test_engine(
+        'sqlite:///:memory:',
+        poolclass=StaticPool,
+        connect_args={'check_same_thread': False}
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    service = ValidationService(session)
+
+    reports = [
+        service.validate_data_quality(_valid_dataframe(), f'file{i}.csv')
+        for i in range(5)
+    ]
+    saved = service.save_validation_reports(reports)
+
+    # Days after the base date for file0 ... file4: file1 is the newest
+    base = datetime(2025, 1, 1)
+    for report, day_offset in zip(saved, [2, 4, 0, 3, 1]):
+        report.timestamp = base + timedelta(days=day_offset)
+    session.commit()
+
+    ids_by_recency = [report.id for report in sorted(saved, key=lambda r: r.timestamp, reverse=True)]
+
+    yield service, ids_by_recency
+
+    session.close()
+    engine.dispose()
+
+
+def _valid_dataframe():
+    """Build valid dashboard data (three consecutive months, sane rates)."""
     return pd.DataFrame({
         'month': ['GMV', 'Funded Amount', '# Invoices', 'USD/EUR Rate'],
         'Jan-25': [10000000, 9000000, 50, 0.92],
@@ -55,6 +199,12 @@ def valid_data():
     })
 
 
+@pytest.fixture
+def valid_data():
+    """Create valid dashboard data for testing."""
+    return _valid_dataframe()
+
+
 @pytest.fixture
 def data_with_missing_values():
     """Create data with missing values."""
@@ -105,8 +255,8 @@ class TestCheckMissingValues:
         issues = validation_service.check_missing_values(empty_data)
 
         assert len(issues) == 1
-        assert issues[0]['severity'] == 'critical'
-        assert 'empty' in issues[0]['message'].lower()
+        assert issues[0].severity == 'critical'
+        assert 'empty' in issues[0].message.lower()
 
     def test_missing_kpi_values(self, validation_service, data_with_missing_values):
         """Test detection of missing KPI values."""
@@ -120,10 +270,10 @@ class TestCheckMissingValues:
         issues = validation_service.check_missing_values(data_with_missing_values)
 
         # Find the currency rate issue
-        rate_issues = [i for i in issues if 'rate' in i['message'].lower() or 'mar-25' in i['message'].lower()]
+        rate_issues = [i for i in issues if 'rate' in i.message.lower() or 'mar-25' in i.message.lower()]
         assert len(rate_issues) > 0
         # Currency rate issues should be critical
-        assert any(i['severity'] == 'critical' for i in rate_issues)
+        assert any(i.severity == 'critical' for i in rate_issues)
 
 
 # Task 37: Test check_negative_values
@@ -141,22 +291,22 @@ class TestCheckNegativeValues:
         """Test detection of negative GMV."""
         issues = validation_service.check_negative_values(data_with_negative_values)
 
-        gmv_issues = [i for i in issues if 'GMV' in i['message']]
+        gmv_issues = [i for i in issues if 'GMV' in i.message]
         assert len(gmv_issues) > 0
-        assert gmv_issues[0]['category'] == 'negative_values'
+        assert gmv_issues[0].category == 'negative_values'
 
     def test_negative_funded_amount(self, validation_service, data_with_negative_values):
         """Test detection of negative funded amount."""
         issues = validation_service.check_negative_values(data_with_negative_values)
 
-        funded_issues = [i for i in issues if 'Funded Amount' in i['message']]
+        funded_issues = [i for i in issues if 'Funded Amount' in i.message]
         assert len(funded_issues) > 0
 
     def test_negative_invoice_count(self, validation_service, data_with_negative_values):
         """Test detection of negative invoice count."""
         issues = validation_service.check_negative_values(data_with_negative_values)
 
-        invoice_issues = [i for i in issues if '# Invoices' in i['message'] or 'Invoices' in i['message']]
+        invoice_issues = [i for i in issues if '# Invoices' in i.message or 'Invoices' in i.message]
         assert len(invoice_issues) > 0
 
     def test_empty_dataframe(self, validation_service):
@@ -166,6 +316,13 @@ class TestCheckNegativeValues:
 
         assert len(issues) == 0
 
+    def test_no_period_columns(self, validation_service):
+        """Test that KPI rows without any period columns return no issues."""
+        data = pd.DataFrame({'month': ['GMV', 'USD/EUR Rate']})
+        issues = validation_service.check_negative_values(data)
+
+        assert len(issues) == 0
+
 
 # Task 38: Test check_period_continuity
 
@@ -191,7 +348,7 @@ class TestCheckPeriodContinuity:
         issues = validation_service.check_period_continuity(data)
 
         # Should detect gaps
-        gap_issues = [i for i in issues if 'Non-consecutive' in i['message']]
+        gap_issues = [i for i in issues if 'Non-consecutive' in i.message]
         assert len(gap_issues) > 0
 
     def test_year_transition(self, validation_service):
@@ -206,7 +363,7 @@ class TestCheckPeriodContinuity:
         issues = validation_service.check_period_continuity(data)
 
         # Should have no issues with year transition
-        continuity_issues = [i for i in issues if 'Non-consecutive' in i['message']]
+        continuity_issues = [i for i in issues if 'Non-consecutive' in i.message]
         assert len(continuity_issues) == 0
 
     def test_invalid_period_format(self, validation_service):
@@ -220,7 +377,7 @@ class TestCheckPeriodContinuity:
         issues = validation_service.check_period_continuity(data)
 
         # Should detect format issues
-        format_issues = [i for i in issues if 'format' in i['message'].lower()]
+        format_issues = [i for i in issues if 'format' in i.message.lower()]
         assert len(format_issues) > 0
 
     def test_single_period(self, validation_service):
@@ -234,7 +391,7 @@ class TestCheckPeriodContinuity:
 
         # Should have info message about not enough periods
         assert len(issues) == 1
-        assert issues[0]['severity'] == 'info'
+        assert issues[0].severity == 'info'
 
 
 # Task 39: Test check_currency_rates
@@ -258,24 +415,24 @@ class TestCheckCurrencyRates:
         issues = validation_service.check_currency_rates(data)
 
         assert len(issues) == 1
-        assert issues[0]['severity'] == 'critical'
-        assert 'not found' in issues[0]['message'].lower()
+        assert issues[0].severity == 'critical'
+        assert 'not found' in issues[0].message.lower()
 
     def test_rate_out_of_range(self, validation_service, data_with_invalid_rates):
         """Test detection of rates outside reasonable range."""
         issues = validation_service.check_currency_rates(data_with_invalid_rates)
 
         # Should find issues with too low, too high, and zero rates
-        range_issues = [i for i in issues if 'range' in i['message'].lower() or 'zero' in i['message'].lower()]
+        range_issues = [i for i in issues if 'range' in i.message.lower() or 'zero' in i.message.lower()]
         assert len(range_issues) > 0
 
     def test_zero_rate_critical(self, validation_service, data_with_invalid_rates):
         """Test that zero rate is flagged as critical."""
         issues = validation_service.check_currency_rates(data_with_invalid_rates)
 
-        zero_issues = [i for i in issues if 'zero' in i['message'].lower()]
+        zero_issues = [i for i in issues if 'zero' in i.message.lower()]
         assert len(zero_issues) > 0
-        assert zero_issues[0]['severity'] == 'critical'
+        assert zero_issues[0].severity == 'critical'
 
     def test_rate_exactly_one(self, validation_service):
         """Test that rate of 1.0 is flagged as info."""
@@ -287,9 +444,9 @@ class TestCheckCurrencyRates:
         issues = validation_service.check_currency_rates(data)
 
         # Should have info message about rate being 1.0
-        one_issues = [i for i in issues if '1.0' in i['message']]
+        one_issues = [i for i in issues if '1.0' in i.message]
         assert len(one_issues) > 0
-        assert one_issues[0]['severity'] == 'info'
+        assert one_issues[0].severity == 'info'
 
 
 # Task 40: Test categorize_issues
@@ -300,10 +457,10 @@ class TestCategorizeIssues:
     def test_categorize_mixed_issues(self, validation_service):
         """Test categorization of issues by severity."""
         issues = [
-            {'severity': 'critical', 'message': 'Critical issue 1'},
-            {'severity': 'critical', 'message': 'Critical issue 2'},
-            {'severity': 'warning', 'message': 'Warning issue 1'},
-            {'severity': 'info', 'message': 'Info issue 1'}
+            Issue(severity='critical', category='test', message='Critical issue 1'),
+            Issue(severity='critical', category='test', message='Critical issue 2'),
+            Issue(severity='warning', category='test', message='Warning issue 1'),
+            Issue(severity='info', category='test', message='Info issue 1')
         ]
 
         summary = validation_service.categorize_issues(issues)
@@ -323,9 +480,9 @@ class TestCategorizeIssues:
     def test_categorize_only_warnings(self, validation_service):
         """Test categorization with only warnings."""
         issues = [
-            {'severity': 'warning', 'message': 'Warning 1'},
-            {'severity': 'warning', 'message': 'Warning 2'},
-            {'severity': 'warning', 'message': 'Warning 3'}
+            Issue(severity='warning', category='test', message='Warning 1'),
+            Issue(severity='warning', category='test', message='Warning 2'),
+            Issue(severity='warning', category='test', message='Warning 3')
         ]
 
         summary = validation_service.categorize_issues(issues)
@@ -363,6 +520,54 @@ class TestValidateDataQuality:
         assert report['status'] == 'critical'
         assert report['summary']['critical'] > 0
 
+    def test_validate_data_without_period_columns(self, validation_service):
+        """Test that a frame with only the month column is reported, not raised."""
+        data = pd.DataFrame({'month': ['GMV', None]})
+
+        report = validation_service.validate_data_quality(data)
+
+        assert report['status'] == 'critical'
+        assert report['summary']['critical'] == 2
+
+    def test_validate_reports_non_numeric_values(self, validation_service, valid_data):
+        """Test that a text value without NaNs or negatives is still checked."""
+        valid_data['Feb-25'] = valid_data['Feb-25'].astype(object)
+        valid_data.loc[0, 'Feb-25'] = 'n/a'
+
+        report = validation_service.validate_data_quality(valid_data)
+
+        messages = [issue['message'] for issue in report['issues']]
+        assert any('Non-numeric value for GMV in Feb-25' in msg for msg in messages)
+
+    def test_validate_parallel_checks_match_serial(self, validation_service, data_with_missing_values, monkeypatch):
+        """Test that running checks on the thread pool keeps the same issues in order."""
+        serial = validation_service.validate_data_quality(data_with_missing_values)
+
+        monkeypatch.setattr('scripts.validation_service.PARALLEL_CHECK_MIN_CELLS', 0)
+        parallel = validation_service.validate_data_quality(data_with_missing_values)
+
+        assert parallel['issues'] == serial['issues']
+        assert parallel['summary'] == serial['summary']
+
+    def test_check_executor_created_once_under_concurrency(self, monkeypatch):
+        """Test that concurrent first calls share a single check pool."""
+        monkeypatch.setattr(validation_module, '_check_executor', None)
+        barrier = threading.Barrier(8)
+        pools = []
+
+        def get_pool():
+            barrier.wait()
+            pools.append(validation_module._get_check_executor())
+
+        threads = [threading.Thread(target=get_pool) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(pool) for pool in pools}) == 1
+        pools[0].shutdown()
+
     def test_validate_includes_all_checks(self, validation_service, valid_data):
         """Test that validation runs all check types."""
         report = validation_service.validate_data_quality(valid_data)
@@ -388,6 +593,19 @@ class TestSaveValidationReport:
         assert saved_report.status == 'pass'
         assert saved_report.data_file == 'test.csv'
 
+    def test_save_reports_in_one_batch(self, validation_service, valid_data, test_db_session):
+        """Test saving several reports at once keeps their order and data."""
+        reports = [
+            validation_service.validate_data_quality(valid_data, f'batch{i}.csv')
+            for i in range(3)
+        ]
+
+        saved_reports = validation_service.save_validation_reports(reports)
+
+        assert [r.data_file for r in saved_reports] == ['batch0.csv', 'batch1.csv', 'batch2.csv']
+        assert all(r.id is not None for r in saved_reports)
+        assert test_db_session.query(ValidationReport).count() == 3
+
     def test_saved_report_retrievable(self, validation_service, valid_data, test_db_session):
         """Test that saved report can be retrieved from database."""
         report = validation_service.validate_data_quality(valid_data)
@@ -413,33 +631,26 @@ class TestGetValidationReports:
 
         assert len(reports) == 0
 
-    def test_get_reports_with_limit(self, validation_service, valid_data):
+    def test_get_reports_with_limit(self, seeded_service):
         """Test retrieving reports with limit."""
-        # Create 5 reports
-        for i in range(5):
-            report = validation_service.validate_data_quality(valid_data, f'file{i}.csv')
-            validation_service.save_validation_report(report)
+        service, ids_by_recency = seeded_service
 
-        # Retrieve with limit of 3
-        reports = validation_service.get_validation_reports(limit=3)
+        # Retrieve with limit of 3 out of the 5 seeded reports
+        reports = service.get_validation_reports(limit=3)
 
-        assert len(reports) == 3
+        assert len(ids_by_recency) == 5
+        assert [r.id for r in reports] == ids_by_recency[:3]
 
-    def test_get_reports_ordered_by_timestamp(self, validation_service, valid_data):
+    def test_get_reports_ordered_by_timestamp(self, seeded_service):
         """Test that reports are ordered by timestamp (most recent first)."""
-        # Create 3 reports
-        saved_reports = []
-        for i in range(3):
-            report = validation_service.validate_data_quality(valid_data, f'file{i}.csv')
-            saved = validation_service.save_validation_report(report)
-            saved_reports.append(saved)
+        service, ids_by_recency = seeded_service
 
         # Retrieve reports
-        reports = validation_service.get_validation_reports()
+        reports = service.get_validation_reports()
 
-        # Should be in reverse order (most recent first)
-        assert reports[0].id == saved_reports[-1].id
-        assert reports[-1].id == saved_reports[0].id
+        # Most recent first, which is not the reverse insertion order
+        assert [r.id for r in reports] == ids_by_recency
+        assert ids_by_recency != sorted(ids_by_recency, reverse=True)
 
     def test_get_reports_with_status_filter(self, validation_service, valid_data, data_with_negative_values):
         """Test filtering reports by status."""
@@ -473,17 +684,15 @@ class TestGetLatestValidationReport:
 
         assert report is None
 
-    def test_get_latest_report(self, validation_service, valid_data):
+    def test_get_latest_report(self, seeded_service):
         """Test retrieving the most recent report."""
-        # Create 3 reports
-        for i in range(3):
-            report = validation_service.validate_data_quality(valid_data, f'file{i}.csv')
-            validation_service.save_validation_report(report)
+        service, ids_by_recency = seeded_service
 
-        latest = validation_service.get_latest_validation_report()
+        latest = service.get_latest_validation_report()
 
         assert latest is not None
-        assert latest.data_file == 'file2.csv'  # Last one created
+        assert latest.id == ids_by_recency[0]
+        assert latest.data_file == 'file1.csv'  # Newest timestamp, not the last inserted
 
     def test_get_latest_returns_most_recent(self, validation_service, valid_data):
         """Test that latest report is truly the most recent."""
@@ -0,0 +1,158 @@
+"""
+Unit tests for webhook_server.py
+
+Tests cover:
+- Successful dashboard updates
+- Error responses (no file ID, fetch failures, timeouts)
+- Rejecting updates while one is still running
+- Health check
+- JSON responses
+"""
+import threading
+from datetime import datetime
+
+import pytest
+
+import webhook_server
+from scripts.exceptions import DataFetchError
+
+
+@pytest.fixture
+def client():
+    """Flask test client for the webhook app."""
+    return webhook_server.app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def reset_update_state(monkeypatch):
+    """Start every test without an in-flight update."""
+    monkeypatch.setattr(webhook_server, '_update_future', None)
+
+
+@pytest.fixture
+def blocked_main(monkeypatch):
+    """Patch fetch_from_sheets.main to block until the test releases it."""
+    release = threading.Event()
+
+    def fake_main(**kwargs):
+        release.wait(timeout=10)
+        return 'data/processed/dashboard_data.json'
+
+    monkeypatch.setattr(webhook_server.fetch_from_sheets, 'main', fake_main)
+    yield release
+
+    # Let the worker finish so later tests get a free executor
+    release.set()
+    if webhook_server._update_future is not None:
+        webhook_server._update_future.result(timeout=10)
+
+
+class TestUpdateDashboard:
+    """Tests for the /update-dashboard endpoint."""
+
+    @pytest.mark.unit
+    def test_update_success(self, client, monkeypatch):
+        """Test that a completed update returns 200 with the output path."""
+        calls = []
+
+        def fake_main(**kwargs):
+            calls.append(kwargs)
+            return 'data/processed/dashboard_data.json'
+
+        monkeypatch.setattr(webhook_server.fetch_from_sheets, 'main', fake_main)
+
+        response = client.post('/update-dashboard')
+
+        assert response.status_code == 200
+        assert response.get_json()['status'] == 'success'
+        assert 'dashboard_data.json' in response.get_json()['output']
+        assert calls[0]['base_dir'] == webhook_server.PROJECT_ROOT
+
+    @pytest.mark.unit
+    def test_update_without_file_id(self, client, monkeypatch):
+        """Test that main() returning None is reported as an error."""
+        monkeypatch.setattr(webhook_server.fetch_from_sheets, 'main', lambda **kwargs: None)
+
+        response = client.post('/update-dashboard')
+
+        assert response.status_code == 500
+        assert response.get_json()['error'] == 'No Google Drive file ID configured'
+
+    @pytest.mark.unit
+    def test_update_fetch_error(self, client, monkeypatch):
+        """Test that a DashboardError from main() returns 500 with its message."""
+        def failing_main(**kwargs):
+            raise DataFetchError('Sheets API unavailable')
+
+        monkeypatch.setattr(webhook_server.fetch_from_sheets, 'main', failing_main)
+
+        response = client.post('/update-dashboard')
+
+        assert response.status_code == 500
+        assert response.get_json()['message'] == 'Update failed'
+        assert response.get_json()['error'] == 'Sheets API unavailable'
+
+    @pytest.mark.unit
+    def test_update_timeout(self, client, blocked_main, monkeypatch):
+        """Test that an update exceeding the timeout returns 500."""
+        monkeypatch.setattr(webhook_server, 'UPDATE_TIMEOUT_SECONDS', 0.05)
+
+        response = client.post('/update-dashboard')
+
+        assert response.status_code == 500
+        assert response.get_json()['message'] == 'Update timed out'
+
+    @pytest.mark.unit
+    def test_update_rejected_while_running(self, client, blocked_main, monkeypatch):
+        """Test that a second update is rejected while the first is still running."""
+        monkeypatch.setattr(webhook_server, 'UPDATE_TIMEOUT_SECONDS', 0.05)
+        client.post('/update-dashboard')
+
+        response = client.post('/update-dashboard')
+        health = client.get('/health')
+
+        assert response.status_code == 409
+        assert response.get_json()['message'] == 'Update already in progress'
+        assert health.status_code == 200
+
+    @pytest.mark.unit
+    def test_get_returns_info(self, client):
+        """Test that GET describes the webhook without starting an update."""
+        response = client.get('/update-dashboard')
+
+        assert response.status_code == 200
+        assert response.get_json()['status'] == 'info'
+        assert webhook_server._update_future is None
+
+
+class TestHealth:
+    """Tests for the /health endpoint."""
+
+    @pytest.mark.unit
+    def test_health(self, client):
+        """Test that the health check reports healthy."""
+        response = client.get('/health')
+
+        assert response.status_code == 200
+        assert response.get_json() == {'status': 'healthy'}
+
+
+class TestJsonResponses:
+    """Tests that JSON responses keep Flask's default serialization."""
+
+    @pytest.mark.unit
+    def test_datetime_uses_http_date(self):
+        """Test that datetimes serialize as HTTP dates, as in Flask."""
+        with webhook_server.app.app_context():
+            response = webhook_server.app.json.response({'t': datetime(2025, 1, 2, 3, 4, 5)})
+
+        assert response.get_json() == {'t': 'Thu, 02 Jan 2025 03:04:05 GMT'}
+
+    @pytest.mark.unit
+    def test_non_string_keys_sorted(self):
+        """Test that non-string keys are accepted and keys are sorted."""
+        with webhook_server.app.app_context():
+            response = webhook_server.app.json.response({2: 'b', 1: 'a'})
+
+        assert response.get_json() == {'1': 'a', '2': 'b'}
+        assert list(response.get_json()) == ['1', '2']
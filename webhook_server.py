@@ -7,42 +7,165 @@ Install dependencies:
 Run:
     python webhook_server.py
 
+    # Production: exec gunicorn instead of Flask's development server
+    PRODUCTION=1 python webhook_server.py
+
 The server listens on http://localhost:5000/update-dashboard
 """
 from flask import Flask, jsonify, request, Response
-from typing import Tuple, Dict, Any
-import subprocess
+from flask.json.provider import DefaultJSONProvider
+from typing import Tuple, Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+import logging
 import os
-import sys
+import threading
 from dotenv import load_dotenv
+from scripts import fetch_from_sheets
+from scripts.exceptions import DashboardError
 from scripts.logger_config import get_logger
 
-# Load environment variables from .env file
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Load environment variables from .env file. Production deployments inject
+# the environment directly, so skip the .env lookup there.
+if os.getenv('PRODUCTION') != '1':
+    load_dotenv()
 
 # Initialize logger
 logger = get_logger(__name__)
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that serializes with orjson.
+
+    jsonify() responses are encoded straight to bytes. Honors sort_keys and
+    accepts non-string keys like the default provider. Dates and dataclasses
+    are passed through to DefaultJSONProvider.default, so they serialize as
+    in Flask (e.g. HTTP dates); falls back to Flask's stdlib encoder for
+    options orjson doesn't support.
+    """
+
+    def _orjson_option(self) -> int:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._orjson_option()).decode('utf-8')
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # Pretty output (compact=False) isn't available from orjson
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        if args and kwargs:
+            raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+        obj = args[0] if len(args) == 1 else (args or kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self._orjson_option()),
+            mimetype=self.mimetype
+        )
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 # Disable Flask's default logging to stdout (we use our logger instead)
-import logging
 log = logging.getLogger('werkzeug')
 log.setLevel(logging.WARNING)
 
-# Add the project root to path so we can import the script
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Relative config, credentials and data paths resolve against the project
+# root (the old subprocess ran there), whatever the process working directory
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Runs fetch_from_sheets in-process (imported once above) instead of spawning
+# a new interpreter per webhook. A single worker serializes updates, since
+# every run writes the same output files.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dashboard-update')
+
+# The update currently owning the worker. New requests are rejected while it
+# runs instead of queueing behind it, so a hung fetch cannot tie up every
+# request thread (and /health with them).
+_update_future: Optional[Future] = None
+_update_lock = threading.Lock()
+
+# Maximum time to wait for an update before responding with a timeout.
+# A timeout does not cancel the update: a running thread cannot be stopped,
+# so the fetch keeps the worker until it finishes on its own.
+UPDATE_TIMEOUT_SECONDS = 300
+
+# Logged once at startup as a single record
+STARTUP_BANNER = "\n".join([
+    "=" * 60,
+    "Starting Webhook Server",
+    "=" * 60,
+    "Server will listen on http://0.0.0.0:5000",
+    "Endpoints:",
+    "  - POST /update-dashboard : Trigger dashboard update",
+    "  - GET  /health          : Health check",
+    "=" * 60,
+])
+
+# gunicorn command used when PRODUCTION=1. One worker process, because
+# updates must not run concurrently (they share output files); its threads
+# keep /health responsive during an update. The worker timeout exceeds the
+# update timeout so gunicorn never kills a request that is still waiting.
+GUNICORN_ARGS = [
+    'gunicorn',
+    '--worker-class', 'gthread',
+    '--workers', '1',
+    '--threads', '4',
+    '--timeout', str(UPDATE_TIMEOUT_SECONDS + 60),
+    '--bind', '0.0.0.0:5000',
+    # Import webhook_server:app from the project root, whatever the launch directory
+    '--chdir', PROJECT_ROOT,
+    'webhook_server:app'
+]
+
+# Environment variables don't change while the server runs; read once
+ENV_CREDENTIALS_FILE = os.getenv('GOOGLE_CREDENTIALS_FILE')
+
+
+def _get_creds_file() -> str:
+    """
+    Resolve the Google credentials file for dashboard updates.
+
+    Returns:
+        str: Path from GOOGLE_CREDENTIALS_FILE, else from config.json, else the default
+    """
+    # Priority 1: Check environment variable (SECURE)
+    if ENV_CREDENTIALS_FILE:
+        return ENV_CREDENTIALS_FILE
+
+    # Priority 2: Fall back to config.json (LEGACY - use .env instead!).
+    # load_config() only re-reads the file when its mtime changes.
+    config = fetch_from_sheets.load_config(PROJECT_ROOT)
+    if config and 'credentials_file' in config and config['credentials_file'] != 'credentials/your-service-account.json':
+        return config['credentials_file']
+    return 'credentials/service-account.json'  # default
 
 @app.route('/update-dashboard', methods=['POST', 'GET'])
 def update_dashboard() -> Tuple[Response, int]:
     """
     Webhook endpoint to trigger dashboard update.
 
+    Responds 409 while a previous update is still running, including one
+    whose request already timed out.
+
     Returns:
         Tuple[Response, int]: JSON response and HTTP status code
     """
+    global _update_future
+
     try:
-        logger.info(f"Received {request.method} request to /update-dashboard from {request.remote_addr}")
+        logger.info("Received %s request to /update-dashboard from %s", request.method, request.remote_addr)
 
         # Get optional parameters from request
         data = request.get_json() if request.is_json else {}
@@ -56,67 +179,58 @@ def update_dashboard() -> Tuple[Response, int]:
                 'endpoint': '/update-dashboard'
             }), 200
 
-        # Priority 1: Check environment variable (SECURE)
-        creds_file = os.getenv('GOOGLE_CREDENTIALS_FILE')
+        creds_file = _get_creds_file()
+        logger.info("Starting dashboard update with credentials: %s", creds_file)
 
-        if not creds_file:
-            # Priority 2: Fall back to config.json (LEGACY - use .env instead!)
-            config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
-            creds_file = 'credentials/service-account.json'  # default
-
-            if os.path.exists(config_path):
-                import json
-                with open(config_path, 'r') as f:
-                    config = json.load(f)
-                    if 'credentials_file' in config and config['credentials_file'] != 'credentials/your-service-account.json':
-                        creds_file = config['credentials_file']
-
-        # Set environment variable for credentials
-        logger.info(f"Starting dashboard update with credentials: {creds_file}")
-        env = os.environ.copy()
-        env['GOOGLE_CREDENTIALS_FILE'] = creds_file
-
-        # Pass Google Drive file ID if set
+        # GOOGLE_DRIVE_FILE_ID is read from the environment by fetch_from_sheets
         if 'GOOGLE_DRIVE_FILE_ID' in os.environ:
-            env['GOOGLE_DRIVE_FILE_ID'] = os.environ['GOOGLE_DRIVE_FILE_ID']
-            logger.debug(f"Using Google Drive file ID from environment")
-
-        # Run the fetch script as a module (required for relative imports)
-        logger.info("Executing fetch_from_sheets.py script...")
-        result = subprocess.run(
-            ['python', '-m', 'scripts.fetch_from_sheets'],
-            cwd=os.path.dirname(os.path.abspath(__file__)),
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
-            env=env
-        )
+            logger.debug("Using Google Drive file ID from environment")
 
-        if result.returncode == 0:
-            logger.info("Dashboard update completed successfully")
-            logger.debug(f"Script output: {result.stdout[:200]}...")  # Log first 200 chars
+        # Run the fetch in the worker thread so the timeout can still be enforced
+        with _update_lock:
+            if _update_future is not None and not _update_future.done():
+                logger.warning("Dashboard update already in progress, rejecting request")
+                return jsonify({
+                    'status': 'error',
+                    'message': 'Update already in progress'
+                }), 409
+            logger.info("Running fetch_from_sheets...")
+            future = _executor.submit(fetch_from_sheets.main, credentials_file=creds_file, base_dir=PROJECT_ROOT)
+            _update_future = future
+        try:
+            output_path = future.result(timeout=UPDATE_TIMEOUT_SECONDS)
+        except FuturesTimeoutError:
+            # The fetch keeps running; later requests get 409 until it ends
+            logger.error("Dashboard update timed out after 5 minutes")
             return jsonify({
-                'status': 'success',
-                'message': 'Dashboard updated successfully',
-                'output': result.stdout
-            }), 200
-        else:
-            logger.error(f"Dashboard update failed with return code {result.returncode}")
-            logger.error(f"Error output: {result.stderr}")
+                'status': 'error',
+                'message': 'Update timed out'
+            }), 500
+        except DashboardError as e:
+            logger.error("Dashboard update failed: %s", e)
             return jsonify({
                 'status': 'error',
                 'message': 'Update failed',
-                'error': result.stderr
+                'error': str(e)
             }), 500
 
-    except subprocess.TimeoutExpired:
-        logger.error("Dashboard update timed out after 5 minutes")
+        if output_path is None:
+            logger.error("Dashboard update skipped: no Google Drive file ID configured")
+            return jsonify({
+                'status': 'error',
+                'message': 'Update failed',
+                'error': 'No Google Drive file ID configured'
+            }), 500
+
+        logger.info("Dashboard update completed successfully")
         return jsonify({
-            'status': 'error',
-            'message': 'Update timed out'
-        }), 500
+            'status': 'success',
+            'message': 'Dashboard updated successfully',
+            'output': f'Dashboard data saved to {output_path}'
+        }), 200
+
     except Exception as e:
-        logger.error(f"Unexpected error during dashboard update: {str(e)}", exc_info=True)
+        logger.error("Unexpected error during dashboard update: %s", e, exc_info=True)
         return jsonify({
             'status': 'error',
             'message': str(e)
@@ -134,15 +248,12 @@ def health() -> Tuple[Response, int]:
     return jsonify({'status': 'healthy'}), 200
 
 if __name__ == '__main__':
-    # Run on localhost:5000
-    # For production, use a proper WSGI server like gunicorn
-    logger.info("=" * 60)
-    logger.info("Starting Webhook Server")
-    logger.info("=" * 60)
-    logger.info("Server will listen on http://0.0.0.0:5000")
-    logger.info("Endpoints:")
-    logger.info("  - POST /update-dashboard : Trigger dashboard update")
-    logger.info("  - GET  /health          : Health check")
-    logger.info("=" * 60)
+    if os.getenv('PRODUCTION') == '1':
+        # Replace this process with gunicorn serving the same app
+        logger.info(f"PRODUCTION=1, starting gunicorn: {' '.join(GUNICORN_ARGS)}")
+        os.execvp(GUNICORN_ARGS[0], GUNICORN_ARGS)
+
+    # Run on localhost:5000 with Flask's development server
+    logger.info(STARTUP_BANNER)
 
     app.run(host='0.0.0.0', port=5000, debug=False)